@@ -13,6 +13,9 @@ from .database import CatalogDatabase, get_catalog_db
 
 logger = get_module_logger("catalog.repository")
 
+# Conservative chunk size for `IN (...)` queries (SQLite default limit is 999).
+SQLITE_MAX_PARAMS = 900
+
 
 class CatalogRepository:
     def __init__(self, db: Optional[CatalogDatabase] = None) -> None:
@@ -179,6 +182,24 @@ class CatalogRepository:
             con.commit()
             return cursor.rowcount > 0
 
+    def touch_video_modified(
+        self, *, video_uid: str, modified_at: str, status: Optional[str] = None
+    ) -> bool:
+        """
+        Bump `modified_at` (and optionally `status`) without rewriting other columns.
+        """
+        with self.db.connection() as con:
+            cursor = con.execute(
+                """
+                UPDATE videos
+                SET modified_at = ?, status = COALESCE(?, status)
+                WHERE video_uid = ?
+                """,
+                (modified_at, status, video_uid),
+            )
+            con.commit()
+            return cursor.rowcount > 0
+
     def find_drive_file_id_by_path(self, path: str) -> Optional[str]:
         with self.db.connection() as con:
             row = con.execute(
@@ -213,6 +234,29 @@ class CatalogRepository:
             ).fetchone()
         return dict(row) if row else {}
 
+    def get_videos_bulk(self, video_uids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return existing video rows keyed by `video_uid` (missing uids are omitted).
+
+        Queries are chunked to stay under SQLite's bound-parameter limit.
+        """
+        uids = list(dict.fromkeys(video_uids))
+        found: Dict[str, Dict[str, Any]] = {}
+        if not uids:
+            return found
+
+        with self.db.connection() as con:
+            for start in range(0, len(uids), SQLITE_MAX_PARAMS):
+                chunk = uids[start : start + SQLITE_MAX_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = con.execute(
+                    f"SELECT * FROM videos WHERE video_uid IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    found[row["video_uid"]] = dict(row)
+        return found
+
     def find_drive_video_uid_by_file_id(self, file_id: str) -> Optional[str]:
         """
         Resolve a Drive video_uid by the Drive video file_id.
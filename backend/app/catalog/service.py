@@ -7,16 +7,15 @@ from __future__ import annotations
 import json
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Set
 
 from app.catalog.repository import CatalogRepository
 from app.catalog.identity import ensure_catalog_id_for_video
 from app.config import settings
 from app.core.blocking import (
-    run_blocking,
-    get_catalog_semaphore,
-    get_fs_semaphore,
-    get_drive_semaphore,
+    run_catalog_blocking,
+    run_fs_blocking,
+    run_drive_blocking,
 )
 from app.core.logging import get_module_logger
 from app.catalog.identity import ensure_catalog_id_for_video
@@ -52,9 +51,8 @@ async def get_catalog_status(repo: Optional[CatalogRepository] = None) -> Dict[s
             },
         }
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _read,
-        semaphore=get_catalog_semaphore(),
         label="catalog.status",
     )
 
@@ -71,11 +69,10 @@ async def bootstrap_local_catalog(
     """
     repo = repo or CatalogRepository()
 
-    videos = await run_blocking(
+    videos = await run_fs_blocking(
         scan_videos_directory,
         base_dir=base_dir,
         use_cache=False,
-        semaphore=get_fs_semaphore(),
         label="catalog.bootstrap.scan",
     )
 
@@ -145,9 +142,8 @@ async def bootstrap_local_catalog(
         repo.touch_state(scope="local", field="last_imported_at")
         return {"deleted": deleted, "inserted": inserted}
 
-    result = await run_blocking(
+    result = await run_catalog_blocking(
         _write,
-        semaphore=get_catalog_semaphore(),
         label="catalog.bootstrap.write",
     )
     logger.info(f"Local catalog bootstrapped: {result}")
@@ -159,12 +155,11 @@ async def list_local_videos_paginated(
 ) -> Dict[str, Any]:
     repo = repo or CatalogRepository()
 
-    result = await run_blocking(
+    result = await run_catalog_blocking(
         repo.get_videos_paginated,
         location="local",
         page=page,
         limit=limit,
-        semaphore=get_catalog_semaphore(),
         label="catalog.list_local",
     )
     # Match existing library response shape
@@ -203,14 +198,84 @@ async def delete_local_video_from_catalog(
     if not settings.CATALOG_ENABLED:
         return
     repo = repo or CatalogRepository()
-    await run_blocking(
+    await run_catalog_blocking(
         repo.delete_video,
         _local_video_uid(video_path),
-        semaphore=get_catalog_semaphore(),
         label="catalog.delete_local",
     )
 
 
+def _write_local_video_row(
+    repo: CatalogRepository,
+    *,
+    video_path: str,
+    base_dir: str,
+    thumbnail_path: Optional[str],
+    extra: Optional[Dict[str, Any]],
+    existing: Dict[str, Any],
+) -> None:
+    full_path = Path(base_dir) / video_path
+    stat = full_path.stat()
+    modified_ts = stat.st_mtime
+
+    title = full_path.stem
+    parts = Path(video_path).parts
+    channel = parts[0] if len(parts) > 1 else "Sem categoria"
+
+    video_uid = _local_video_uid(video_path)
+
+    duration_seconds = existing.get("duration_seconds") if existing else None
+    existing_extra: Dict[str, Any] = {}
+    if existing and existing.get("extra_json"):
+        try:
+            existing_extra = json.loads(existing["extra_json"])
+        except Exception:
+            existing_extra = {}
+    try:
+        catalog_id = ensure_catalog_id_for_video(full_path)
+    except Exception:
+        catalog_id = None
+    if catalog_id:
+        existing_extra.setdefault("catalog_id", catalog_id)
+    if extra:
+        existing_extra.update(extra)
+    extra_payload = existing_extra or None
+
+    if thumbnail_path:
+        thumb_path = Path(base_dir) / thumbnail_path
+        if thumb_path.exists():
+            try:
+                modified_ts = max(modified_ts, thumb_path.stat().st_mtime)
+            except Exception:
+                pass
+
+    repo.upsert_video(
+        video_uid=video_uid,
+        location="local",
+        source=existing.get("source", "custom") if existing else "custom",
+        title=title,
+        channel=channel,
+        duration_seconds=duration_seconds,
+        created_at=existing.get("created_at") if existing else _stat_iso(stat.st_ctime),
+        modified_at=_stat_iso(modified_ts),
+        status="available",
+        extra=extra_payload,
+    )
+
+    assets = [
+        {
+            "kind": "video",
+            "local_path": video_path,
+            "mime_type": None,
+            "size_bytes": stat.st_size,
+        }
+    ]
+    if thumbnail_path:
+        assets.append({"kind": "thumbnail", "local_path": thumbnail_path})
+
+    repo.replace_assets(video_uid=video_uid, location="local", assets=assets)
+
+
 async def upsert_local_video_from_fs(
     *,
     video_path: str,
@@ -228,72 +293,65 @@ async def upsert_local_video_from_fs(
     repo = repo or CatalogRepository()
 
     def _run() -> None:
-        full_path = Path(base_dir) / video_path
-        stat = full_path.stat()
-        modified_ts = stat.st_mtime
+        _write_local_video_row(
+            repo,
+            video_path=video_path,
+            base_dir=base_dir,
+            thumbnail_path=thumbnail_path,
+            extra=extra,
+            existing=repo.get_video(_local_video_uid(video_path)),
+        )
 
-        title = full_path.stem
-        parts = Path(video_path).parts
-        channel = parts[0] if len(parts) > 1 else "Sem categoria"
+    await run_catalog_blocking(
+        _run,
+        label="catalog.upsert_local",
+    )
 
-        video_uid = _local_video_uid(video_path)
 
-        existing = repo.get_video(video_uid)
-        duration_seconds = existing.get("duration_seconds") if existing else None
-        existing_extra: Dict[str, Any] = {}
-        if existing and existing.get("extra_json"):
-            try:
-                existing_extra = json.loads(existing["extra_json"])
-            except Exception:
-                existing_extra = {}
-        try:
-            catalog_id = ensure_catalog_id_for_video(full_path)
-        except Exception:
-            catalog_id = None
-        if catalog_id:
-            existing_extra.setdefault("catalog_id", catalog_id)
-        if extra:
-            existing_extra.update(extra)
-        extra_payload = existing_extra or None
-
-        if thumbnail_path:
-            thumb_path = Path(base_dir) / thumbnail_path
-            if thumb_path.exists():
-                try:
-                    modified_ts = max(modified_ts, thumb_path.stat().st_mtime)
-                except Exception:
-                    pass
+async def upsert_local_videos_bulk(
+    *,
+    video_paths: List[str],
+    base_dir: str,
+    thumbnail_paths: Optional[Dict[str, str]] = None,
+    repo: Optional[CatalogRepository] = None,
+) -> int:
+    """
+    Upsert many local video records from the filesystem in one blocking call.
 
-        repo.upsert_video(
-            video_uid=video_uid,
-            location="local",
-            source=existing.get("source", "custom") if existing else "custom",
-            title=title,
-            channel=channel,
-            duration_seconds=duration_seconds,
-            created_at=existing.get("created_at") if existing else _stat_iso(stat.st_ctime),
-            modified_at=_stat_iso(modified_ts),
-            status="available",
-            extra=extra_payload,
-        )
+    Existing rows are fetched with a single bulk query instead of one SELECT per
+    video. A file that fails to write (gone from disk, locked database, ...)
+    is logged and skipped without aborting the rest of the batch.
 
-        assets = [
-            {
-                "kind": "video",
-                "local_path": video_path,
-                "mime_type": None,
-                "size_bytes": stat.st_size,
-            }
-        ]
-        if thumbnail_path:
-            assets.append({"kind": "thumbnail", "local_path": thumbnail_path})
+    Returns the number of videos written.
+    """
+    if not settings.CATALOG_ENABLED or not video_paths:
+        return 0
+
+    repo = repo or CatalogRepository()
+    thumbnail_paths = thumbnail_paths or {}
 
-        repo.replace_assets(video_uid=video_uid, location="local", assets=assets)
+    def _run() -> int:
+        existing_rows = repo.get_videos_bulk([_local_video_uid(p) for p in video_paths])
+        written = 0
+        for video_path in video_paths:
+            try:
+                _write_local_video_row(
+                    repo,
+                    video_path=video_path,
+                    base_dir=base_dir,
+                    thumbnail_path=thumbnail_paths.get(video_path),
+                    extra=None,
+                    existing=existing_rows.get(_local_video_uid(video_path), {}),
+                )
+            except Exception as e:
+                logger.warning(f"Catalog update skipped for {video_path}: {e}")
+                continue
+            written += 1
+        return written
 
-    await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
-        label="catalog.upsert_local",
+        label="catalog.upsert_local_bulk",
     )
 
 
@@ -319,10 +377,9 @@ async def rename_local_video_in_catalog(
         except Exception:
             old_extra = None
     # Remove old record (uid changes in our current local scheme)
-    await run_blocking(
+    await run_catalog_blocking(
         repo.delete_video,
         old_uid,
-        semaphore=get_catalog_semaphore(),
         label="catalog.rename.delete",
     )
 
@@ -368,9 +425,8 @@ async def set_local_catalog_id(
         extra["catalog_id"] = catalog_id
         return repo.update_video_extra(video_uid=video_uid, extra=extra)
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.link_local_catalog_id",
     )
 
@@ -408,27 +464,33 @@ async def set_local_drive_file_id(
         extra["drive_file_id"] = drive_file_id
         return repo.update_video_extra(video_uid=video_uid, extra=extra)
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.link_local_drive_id",
     )
 
+
+# Lowercased extension -> asset kind. `.info.json` is special-cased below.
+_EXT_KIND: Dict[str, str] = {
+    **{ext: "video" for ext in settings.VIDEO_EXTENSIONS},
+    **{ext: "thumbnail" for ext in settings.THUMBNAIL_EXTENSIONS},
+    ".description": "other",
+    ".vtt": "subtitles",
+    ".srt": "subtitles",
+    ".ass": "subtitles",
+    ".txt": "transcript",
+}
+
+
 def _asset_kind_for_name(file_name: str) -> Optional[str]:
-    name = file_name.lower()
-    if any(name.endswith(ext) for ext in settings.VIDEO_EXTENSIONS):
-        return "video"
-    if any(name.endswith(ext) for ext in settings.THUMBNAIL_EXTENSIONS):
-        return "thumbnail"
-    if name.endswith(".info.json"):
+    # Only lowercase the extension tail instead of the whole file name.
+    dot = file_name.rfind(".")
+    if dot < 0:
+        return None
+    ext = file_name[dot:].lower()
+    if ext == ".json" and dot >= 5 and file_name[dot - 5 : dot].lower() == ".info":
         return "info_json"
-    if name.endswith(".description"):
-        return "other"
-    if any(name.endswith(ext) for ext in (".vtt", ".srt", ".ass")):
-        return "subtitles"
-    if name.endswith(".txt"):
-        return "transcript"
-    return None
+    return _EXT_KIND.get(ext)
 
 
 async def upsert_drive_video_from_upload(
@@ -533,9 +595,8 @@ async def upsert_drive_video_from_upload(
 
         repo.replace_assets(video_uid=video_uid, location="drive", assets=assets)
 
-    await run_blocking(
+    await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.upsert_drive_upload",
     )
 
@@ -546,10 +607,9 @@ async def delete_drive_video_from_catalog(
     if not settings.CATALOG_ENABLED:
         return False
     repo = repo or CatalogRepository()
-    return await run_blocking(
+    return await run_catalog_blocking(
         repo.delete_drive_video_by_file_id,
         video_file_id,
-        semaphore=get_catalog_semaphore(),
         label="catalog.delete_drive",
     )
 
@@ -625,9 +685,8 @@ async def rename_drive_video_in_catalog(
                     repo.update_video_extra(video_uid=local_uid, extra=local_extra)
         return True
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.rename_drive",
     )
 
@@ -651,31 +710,11 @@ async def set_drive_thumbnail_in_catalog(
         filtered = [a for a in assets if a.get("kind") != "thumbnail"]
         filtered.append({"kind": "thumbnail", "drive_file_id": thumbnail_file_id})
         repo.replace_assets(video_uid=video_uid, location="drive", assets=filtered)
-
-        row = repo.get_video(video_uid)
-        extra = None
-        if row.get("extra_json"):
-            try:
-                extra = json.loads(row["extra_json"])
-            except Exception:
-                extra = None
-        repo.upsert_video(
-            video_uid=video_uid,
-            location="drive",
-            source=row.get("source") or "custom",
-            title=row.get("title"),
-            channel=row.get("channel"),
-            duration_seconds=row.get("duration_seconds"),
-            created_at=row.get("created_at"),
-            modified_at=_iso_now(),
-            status=row.get("status") or "available",
-            extra=extra,
-        )
+        repo.touch_video_modified(video_uid=video_uid, modified_at=_iso_now())
         return True
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.set_drive_thumbnail",
     )
 
@@ -721,9 +760,8 @@ async def set_drive_share_metadata_in_catalog(
         )
         return True
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.set_drive_share",
     )
 
@@ -767,9 +805,8 @@ async def clear_drive_share_metadata_in_catalog(
         )
         return True
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.clear_drive_share",
     )
 
@@ -848,9 +885,8 @@ async def import_drive_snapshot_bytes(
         repo.touch_state(scope="drive", field="last_imported_at")
         return {"deleted": deleted, "inserted": inserted, "generated_at": payload.get("generated_at")}
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="catalog.import_drive",
     )
 
@@ -864,12 +900,11 @@ async def list_drive_videos_paginated(
     Response shape matches existing `/api/drive/videos` items used by the UI.
     """
     repo = repo or CatalogRepository()
-    result = await run_blocking(
+    result = await run_catalog_blocking(
         repo.get_videos_paginated,
         location="drive",
         page=page,
         limit=limit,
-        semaphore=get_catalog_semaphore(),
         label="catalog.list_drive",
     )
 
@@ -925,40 +960,75 @@ async def publish_drive_snapshot(
     """
     from app.catalog.drive_snapshot import build_drive_snapshot, encode_drive_snapshot
     from app.drive.manager import drive_manager
-    from app.core.exceptions import DriveNotAuthenticatedException
+    from app.core.exceptions import DriveNotAuthenticatedException, InvalidRequestException
     from googleapiclient.http import MediaIoBaseUpload
     import io
 
     repo = repo or CatalogRepository()
     if require_import_before_publish is None:
         require_import_before_publish = settings.CATALOG_DRIVE_REQUIRE_IMPORT_BEFORE_PUBLISH
-    def _publish() -> Dict[str, Any]:
-        if not drive_manager.is_authenticated():
-            raise DriveNotAuthenticatedException()
 
-        items = repo.export_drive_snapshot_items()
+    file_name = "catalog-drive.json.gz"
 
+    def _encode() -> tuple[Dict[str, Any], bytes, int]:
+        items = repo.export_drive_snapshot_items()
         payload = build_drive_snapshot(videos=items)
-        blob = encode_drive_snapshot(payload)
+        return payload, encode_drive_snapshot(payload), len(items)
 
+    def _lookup() -> tuple[str, List[Dict[str, Any]]]:
         service = drive_manager.get_service()
         root_id = drive_manager.get_or_create_root_folder()
         catalog_folder_id = drive_manager.ensure_folder(".catalog", root_id)
 
-        file_name = "catalog-drive.json.gz"
         query = f"name='{file_name}' and '{catalog_folder_id}' in parents and trashed=false"
         results = service.files().list(q=query, fields="files(id, name)").execute()
-        existing = results.get("files", [])
+        return catalog_folder_id, results.get("files", [])
 
-        if existing and require_import_before_publish and not force:
-            state = repo.get_state("drive")
-            if not state.get("last_imported_at"):
-                from app.core.exceptions import InvalidRequestException
+    # Check auth before doing any work: auto-publish runs after every Drive
+    # mutation and must stay cheap when the user is not logged in.
+    authenticated = await run_drive_blocking(
+        drive_manager.is_authenticated,
+        label="catalog.publish_drive.auth",
+    )
+    if not authenticated:
+        raise DriveNotAuthenticatedException()
 
-                raise InvalidRequestException(
-                    "Catálogo do Drive já existe: rode /api/catalog/drive/import antes de publicar (ou use force=true)."
+    # Snapshot encoding does not depend on the Drive folder lookup, so run both
+    # concurrently and let the CPU-bound encode hide behind the lookup round-trips.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            encode_task = tg.create_task(
+                run_catalog_blocking(
+                    _encode,
+                    label="catalog.publish_drive.encode",
                 )
+            )
+            lookup_task = tg.create_task(
+                run_drive_blocking(
+                    _lookup,
+                    label="catalog.publish_drive.lookup",
+                )
+            )
+    except BaseExceptionGroup as eg:
+        # Surface the original error so exception handlers keep working.
+        raise eg.exceptions[0]
+
+    payload, blob, video_count = encode_task.result()
+    catalog_folder_id, existing = lookup_task.result()
+
+    if existing and require_import_before_publish and not force:
+        state = await run_catalog_blocking(
+            repo.get_state,
+            "drive",
+            label="catalog.publish_drive.state",
+        )
+        if not state.get("last_imported_at"):
+            raise InvalidRequestException(
+                "Catálogo do Drive já existe: rode /api/catalog/drive/import antes de publicar (ou use force=true)."
+            )
 
+    def _upload() -> Dict[str, Any]:
+        service = drive_manager.get_service()
         media = MediaIoBaseUpload(io.BytesIO(blob), mimetype="application/gzip", resumable=False)
 
         if existing:
@@ -993,34 +1063,110 @@ async def publish_drive_snapshot(
             "name": response.get("name"),
             "size": response.get("size"),
             "generated_at": payload.get("generated_at"),
-            "videos": len(items),
+            "videos": video_count,
         }
 
-    return await run_blocking(
-        _publish,
-        semaphore=get_drive_semaphore(),
+    return await run_drive_blocking(
+        _upload,
         label="catalog.publish_drive",
     )
 
 
+# Debounced auto-publish state (one pending publish per event loop). The most
+# recent caller's reason/repo are the ones published; tasks stay referenced in
+# `_publish_tasks` until they finish.
+_publish_task: Optional[asyncio.Task] = None
+_publish_tasks: Set[asyncio.Task] = set()
+_publish_deadline: float = 0.0
+_publish_reason: str = ""
+_publish_repo: Optional[CatalogRepository] = None
+
+
+async def _publish_best_effort(*, reason: str, repo: Optional[CatalogRepository]) -> Optional[Dict[str, Any]]:
+    try:
+        return await publish_drive_snapshot(repo=repo)
+    except Exception as e:
+        logger.warning(f"Auto-publish skipped ({reason}): {e}")
+        return None
+
+
+async def _debounced_publish() -> None:
+    global _publish_task
+
+    loop = asyncio.get_running_loop()
+    while True:
+        delay = _publish_deadline - loop.time()
+        if delay <= 0:
+            break
+        await asyncio.sleep(delay)
+
+    # Mutations arriving while we upload schedule a fresh publish.
+    _publish_task = None
+    await _publish_best_effort(reason=_publish_reason, repo=_publish_repo)
+
+
 async def maybe_publish_drive_snapshot(
     *, reason: str, repo: Optional[CatalogRepository] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Publish the Drive snapshot if catalog + auto-publish are enabled.
 
+    Bursts of calls are coalesced: each call (re)starts a quiet window of
+    `CATALOG_DRIVE_PUBLISH_DEBOUNCE_S` seconds and a single publish runs in the
+    background once it elapses (returns None), using the latest call's
+    `reason`/`repo`. With a zero window the publish runs inline and its result
+    is returned.
+
     This is a best-effort helper: failures are logged and swallowed to avoid
     breaking the original Drive action.
     """
+    global _publish_task, _publish_deadline, _publish_reason, _publish_repo
+
     if not settings.CATALOG_ENABLED or not settings.CATALOG_DRIVE_AUTO_PUBLISH:
         return None
 
     repo = repo or CatalogRepository()
-    try:
-        return await publish_drive_snapshot(repo=repo)
-    except Exception as e:
-        logger.warning(f"Auto-publish skipped ({reason}): {e}")
-        return None
+    debounce_s = settings.CATALOG_DRIVE_PUBLISH_DEBOUNCE_S
+    if debounce_s <= 0:
+        return await _publish_best_effort(reason=reason, repo=repo)
+
+    loop = asyncio.get_running_loop()
+    _publish_deadline = loop.time() + debounce_s
+    _publish_reason = reason
+    _publish_repo = repo
+    task = _publish_task
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = asyncio.create_task(_debounced_publish())
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
+        _publish_task = task
+    return None
+
+
+async def flush_pending_drive_publish() -> None:
+    """
+    Run a still-debouncing publish immediately and wait for in-flight ones.
+
+    Called on application shutdown so a publish scheduled inside the debounce
+    window is not lost.
+    """
+    global _publish_task
+
+    loop = asyncio.get_running_loop()
+    pending = _publish_task
+    if pending is not None and not pending.done() and pending.get_loop() is loop:
+        # Still sleeping (the task clears _publish_task before publishing).
+        _publish_task = None
+        pending.cancel()
+        try:
+            await pending
+        except asyncio.CancelledError:
+            pass
+        await _publish_best_effort(reason=_publish_reason, repo=_publish_repo)
+
+    in_flight = [t for t in _publish_tasks if not t.done() and t.get_loop() is loop]
+    if in_flight:
+        await asyncio.gather(*in_flight, return_exceptions=True)
 
 
 async def rebuild_drive_catalog_from_drive(
@@ -1092,9 +1238,8 @@ async def rebuild_drive_catalog_from_drive(
         repo.touch_state(scope="drive", field="last_imported_at")
         return {"deleted": deleted, "inserted": inserted}
 
-    result = await run_blocking(
+    result = await run_catalog_blocking(
         _write,
-        semaphore=get_catalog_semaphore(),
         label="catalog.rebuild.write",
     )
 
@@ -11,11 +11,27 @@ Example .env file:
     LOG_LEVEL=DEBUG
     DOWNLOADS_DIR=./my-downloads
 """
+from functools import cache, cached_property
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import Annotated, Any, Dict, FrozenSet, Tuple
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+# Source field -> cached derived properties to invalidate when it is reassigned.
+_DERIVED_FROM: Dict[str, Tuple[str, ...]] = {
+    "CATALOG_DB_PATH": ("catalog_db_path",),
+    "WORKER_ROLE": ("start_background_tasks",),
+}
+
+# Settings attribute -> (core.constants class, attribute) it is an alias of.
+_SHARED_CONSTANTS: Dict[str, Tuple[str, str]] = {
+    "VIDEO_EXTENSIONS": ("FileExtensions", "VIDEO"),
+    "THUMBNAIL_EXTENSIONS": ("FileExtensions", "THUMBNAIL"),
+    "VIDEO_MIME_TYPES": ("MimeTypes", "VIDEO"),
+    "IMAGE_MIME_TYPES": ("MimeTypes", "IMAGE"),
+}
 
 
 class Settings(BaseSettings):
@@ -107,6 +123,11 @@ class Settings(BaseSettings):
         default=True,
         description="Publish Drive catalog snapshot after Drive mutations when catalog is enabled"
     )
+    CATALOG_DRIVE_PUBLISH_DEBOUNCE_S: float = Field(
+        default=2.0,
+        ge=0,
+        description="Quiet window (seconds) to coalesce Drive snapshot auto-publishes (0 publishes immediately)"
+    )
     CATALOG_DRIVE_REQUIRE_IMPORT_BEFORE_PUBLISH: bool = Field(
         default=True,
         description="Require importing Drive snapshot before publishing when an existing snapshot is detected"
@@ -116,9 +137,9 @@ class Settings(BaseSettings):
         description="When catalog is enabled and Drive catalog is empty, allow falling back to legacy Drive listing (slow)"
     )
 
-    # CORS - comma-separated string for env var, converted to list
-    CORS_ORIGINS: str = Field(
-        default="http://localhost:3000,http://localhost:3001,http://localhost:3002",
+    # CORS - comma-separated string in env, parsed once into a tuple
+    CORS_ORIGINS: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=("http://localhost:3000", "http://localhost:3001", "http://localhost:3002"),
         description="Allowed CORS origins (comma-separated)"
     )
 
@@ -255,8 +276,8 @@ class Settings(BaseSettings):
         ge=0,
         description="Drive upload retry backoff base (seconds)"
     )
-    DRIVE_UPLOAD_RETRY_STATUSES: List[int] = Field(
-        default_factory=lambda: [429, 500, 502, 503, 504],
+    DRIVE_UPLOAD_RETRY_STATUSES: FrozenSet[int] = Field(
+        default=frozenset({429, 500, 502, 503, 504}),
         description="HTTP statuses to retry for Drive uploads"
     )
     DRIVE_LIST_PAGE_SIZE: int = Field(
@@ -274,19 +295,27 @@ class Settings(BaseSettings):
         extra="ignore",  # Ignore extra fields in .env
     )
 
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
+    def _split_cors_origins(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return tuple(origin.strip() for origin in value.split(",") if origin.strip())
+        return value
+
+    # Derived values are computed once and cached on the instance. Assigning one
+    # of the source fields (e.g. tests monkeypatching settings) drops the cache.
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        for cached in _DERIVED_FROM.get(name, ()):
+            self.__dict__.pop(cached, None)
+
     # Computed property for BASE_DIR
-    @property
+    @cached_property
     def BASE_DIR(self) -> Path:
         """Base directory of the backend application"""
         return Path(__file__).parent.parent
 
-    # Computed property to convert CORS string to list
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """CORS origins as a list"""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
-
-    @property
+    @cached_property
     def catalog_db_path(self) -> str:
         """Catalog database path resolved to an absolute path under backend/ when relative."""
         if self.CATALOG_DB_PATH == ":memory:":
@@ -296,36 +325,30 @@ class Settings(BaseSettings):
             return str(p)
         return str((self.BASE_DIR / p).resolve())
 
-    @property
+    @cached_property
     def start_background_tasks(self) -> bool:
         """Whether to start background tasks for this process."""
         return self.WORKER_ROLE.lower() in {"worker", "both"}
 
-    # Static configurations - imported from core.constants for consistency
-    # These are duplicated here for backward compatibility with existing code
-    # that accesses them via settings.VIDEO_EXTENSIONS etc.
-    VIDEO_EXTENSIONS: Set[str] = {'.mp4', '.mkv', '.webm', '.avi', '.mov', '.flv', '.wmv', '.m4v'}
-    THUMBNAIL_EXTENSIONS: List[str] = ['.jpg', '.jpeg', '.png', '.webp']
-
-    VIDEO_MIME_TYPES: Dict[str, str] = {
-        '.mp4': 'video/mp4',
-        '.webm': 'video/webm',
-        '.mkv': 'video/x-matroska',
-        '.avi': 'video/x-msvideo',
-        '.mov': 'video/quicktime',
-        '.flv': 'video/x-flv',
-        '.wmv': 'video/x-ms-wmv',
-        '.m4v': 'video/x-m4v',
-    }
-
-    IMAGE_MIME_TYPES: Dict[str, str] = {
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.png': 'image/png',
-        '.webp': 'image/webp',
-        '.gif': 'image/gif',
-    }
+    def __getattr__(self, name: str) -> Any:
+        # Static configurations live in core.constants as shared read-only
+        # objects. They are resolved lazily (core imports settings) and bound
+        # on the class so later lookups skip this hook.
+        target = _SHARED_CONSTANTS.get(name)
+        if target is None:
+            return super().__getattr__(name)
+        from app.core import constants
+
+        value = getattr(getattr(constants, target[0]), target[1])
+        setattr(type(self), name, value)
+        return value
+
+
+@cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading env/.env only on first call."""
+    return Settings()
 
 
 # Singleton instance
-settings = Settings()
+settings = get_settings()
@@ -1,10 +1,18 @@
 """
 Helpers to run blocking IO without freezing the event loop.
+
+Each kind of blocking work (Drive API, filesystem, catalog sqlite) runs on its
+own bounded thread pool; the pool size is the concurrency limit, so slow Drive
+calls never queue behind (or starve) unrelated work on the default executor.
 """
 from __future__ import annotations
 
 import asyncio
-from typing import Callable, Optional, TypeVar
+import contextvars
+import functools
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
 from app.config import settings
 from app.core.logging import get_module_logger
@@ -13,74 +21,61 @@ T = TypeVar("T")
 
 logger = get_module_logger("core.blocking")
 
-_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
-
-
-def _get_semaphore(name: str, limit: int) -> asyncio.Semaphore:
-    semaphore = _SEMAPHORES.get(name)
-    if semaphore is None:
-        semaphore = asyncio.Semaphore(limit)
-        _SEMAPHORES[name] = semaphore
-    return semaphore
-
-
-def get_drive_semaphore() -> asyncio.Semaphore:
-    return _get_semaphore("drive", settings.BLOCKING_DRIVE_CONCURRENCY)
-
-
-def get_fs_semaphore() -> asyncio.Semaphore:
-    return _get_semaphore("fs", settings.BLOCKING_FS_CONCURRENCY)
-
+# Limits are read once at import; changing them requires a restart.
+_DRIVE_LIMIT: int = settings.BLOCKING_DRIVE_CONCURRENCY
+_FS_LIMIT: int = settings.BLOCKING_FS_CONCURRENCY
+_CATALOG_LIMIT: int = settings.BLOCKING_CATALOG_CONCURRENCY
 
-def get_catalog_semaphore() -> asyncio.Semaphore:
-    return _get_semaphore("catalog", settings.BLOCKING_CATALOG_CONCURRENCY)
+_DRIVE_POOL = ThreadPoolExecutor(max_workers=_DRIVE_LIMIT, thread_name_prefix="blocking-drive")
+_FS_POOL = ThreadPoolExecutor(max_workers=_FS_LIMIT, thread_name_prefix="blocking-fs")
+_CATALOG_POOL = ThreadPoolExecutor(max_workers=_CATALOG_LIMIT, thread_name_prefix="blocking-catalog")
 
 
 async def run_blocking(
     fn: Callable[..., T],
     *args,
-    semaphore: Optional[asyncio.Semaphore] = None,
+    executor: Optional[Executor] = None,
     label: Optional[str] = None,
     **kwargs,
 ) -> T:
-    if semaphore is None:
-        return await asyncio.to_thread(fn, *args, **kwargs)
-
-    async with semaphore:
-        if label:
-            logger.debug(f"Blocking start: {label}")
-        try:
-            return await asyncio.to_thread(fn, *args, **kwargs)
-        finally:
-            if label:
-                logger.debug(f"Blocking end: {label}")
+    """Run ``fn`` on ``executor`` (default loop executor when None)."""
+    loop = asyncio.get_running_loop()
+    # Keep the caller's context (request_id) visible to logs emitted in the thread.
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    if not label or not logger.isEnabledFor(logging.DEBUG):
+        return await loop.run_in_executor(executor, call)
+
+    logger.debug("Blocking start: %s", label)
+    try:
+        return await loop.run_in_executor(executor, call)
+    finally:
+        logger.debug("Blocking end: %s", label)
+
+
+# The bound helpers are plain functions returning run_blocking's coroutine, so
+# each call costs one coroutine frame instead of a wrapper awaiting another.
+def run_drive_blocking(
+    fn: Callable[..., T],
+    *args,
+    label: Optional[str] = None,
+    **kwargs,
+) -> Coroutine[Any, Any, T]:
+    return run_blocking(fn, *args, executor=_DRIVE_POOL, label=label, **kwargs)
 
 
-async def run_drive_blocking(
+def run_fs_blocking(
     fn: Callable[..., T],
     *args,
     label: Optional[str] = None,
     **kwargs,
-) -> T:
-    return await run_blocking(
-        fn,
-        *args,
-        semaphore=get_drive_semaphore(),
-        label=label,
-        **kwargs,
-    )
+) -> Coroutine[Any, Any, T]:
+    return run_blocking(fn, *args, executor=_FS_POOL, label=label, **kwargs)
 
 
-async def run_fs_blocking(
+def run_catalog_blocking(
     fn: Callable[..., T],
     *args,
     label: Optional[str] = None,
     **kwargs,
-) -> T:
-    return await run_blocking(
-        fn,
-        *args,
-        semaphore=get_fs_semaphore(),
-        label=label,
-        **kwargs,
-    )
+) -> Coroutine[Any, Any, T]:
+    return run_blocking(fn, *args, executor=_CATALOG_POOL, label=label, **kwargs)
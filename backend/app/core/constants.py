@@ -5,7 +5,8 @@ This module contains all static constants used across the application,
 organized by category for easy maintenance and reference.
 """
 from enum import Enum
-from typing import Dict, Set, List, FrozenSet
+from types import MappingProxyType
+from typing import Set, List, FrozenSet, Mapping, Tuple
 
 
 # =============================================================================
@@ -35,7 +36,8 @@ class FileExtensions:
         '.json', '.info.json', '.description', '.txt'
     })
 
-    THUMBNAIL: List[str] = ['.jpg', '.jpeg', '.png', '.webp']
+    # Ordered by lookup preference
+    THUMBNAIL: Tuple[str, ...] = ('.jpg', '.jpeg', '.png', '.webp')
 
     # All supported media extensions
     ALL_MEDIA: FrozenSet[str] = VIDEO | AUDIO | IMAGE
@@ -48,7 +50,7 @@ class FileExtensions:
 class MimeTypes:
     """MIME type mappings for different file types."""
 
-    VIDEO: Dict[str, str] = {
+    VIDEO: Mapping[str, str] = MappingProxyType({
         '.mp4': 'video/mp4',
         '.webm': 'video/webm',
         '.mkv': 'video/x-matroska',
@@ -57,9 +59,9 @@ class MimeTypes:
         '.flv': 'video/x-flv',
         '.wmv': 'video/x-ms-wmv',
         '.m4v': 'video/x-m4v',
-    }
+    })
 
-    AUDIO: Dict[str, str] = {
+    AUDIO: Mapping[str, str] = MappingProxyType({
         '.mp3': 'audio/mpeg',
         '.m4a': 'audio/mp4',
         '.wav': 'audio/wav',
@@ -67,27 +69,28 @@ class MimeTypes:
         '.opus': 'audio/opus',
         '.ogg': 'audio/ogg',
         '.aac': 'audio/aac',
-    }
+    })
 
-    IMAGE: Dict[str, str] = {
+    IMAGE: Mapping[str, str] = MappingProxyType({
         '.jpg': 'image/jpeg',
         '.jpeg': 'image/jpeg',
         '.png': 'image/png',
         '.webp': 'image/webp',
         '.gif': 'image/gif',
         '.bmp': 'image/bmp',
-    }
+    })
+
+    # Single lookup table for get(); VIDEO wins over AUDIO over IMAGE on overlap
+    ALL: Mapping[str, str] = MappingProxyType({**IMAGE, **AUDIO, **VIDEO})
 
     @classmethod
     def get(cls, extension: str, default: str = 'application/octet-stream') -> str:
         """Get MIME type for any supported extension."""
-        ext = extension.lower()
-        return (
-            cls.VIDEO.get(ext) or
-            cls.AUDIO.get(ext) or
-            cls.IMAGE.get(ext) or
-            default
-        )
+        # Suffixes are almost always lowercase already; only fold on a miss.
+        mime = cls.ALL.get(extension)
+        if mime is None:
+            mime = cls.ALL.get(extension.lower(), default)
+        return mime
 
 
 # =============================================================================
@@ -106,12 +109,21 @@ class JobStatus(str, Enum):
     @classmethod
     def is_active(cls, status: str) -> bool:
         """Check if job is still active (can be cancelled)."""
-        return status in {cls.PENDING.value, cls.DOWNLOADING.value}
+        return status in _ACTIVE_JOB_STATUSES
 
     @classmethod
     def is_finished(cls, status: str) -> bool:
         """Check if job has finished (any final state)."""
-        return status in {cls.COMPLETED.value, cls.ERROR.value, cls.CANCELLED.value}
+        return status in _FINISHED_JOB_STATUSES
+
+
+# Kept outside the Enum body, where any assignment would become a member.
+_ACTIVE_JOB_STATUSES: FrozenSet[str] = frozenset({
+    JobStatus.PENDING.value, JobStatus.DOWNLOADING.value,
+})
+_FINISHED_JOB_STATUSES: FrozenSet[str] = frozenset({
+    JobStatus.COMPLETED.value, JobStatus.ERROR.value, JobStatus.CANCELLED.value,
+})
 
 
 # =============================================================================
@@ -163,7 +175,7 @@ class RelatedFilePatterns:
     """Patterns for finding related files (thumbnails, subtitles, etc)."""
 
     # File suffixes to look for when deleting a video
-    SUFFIXES: List[str] = [
+    SUFFIXES: Tuple[str, ...] = (
         '.info.json',
         '.description',
         '.jpg',
@@ -177,7 +189,7 @@ class RelatedFilePatterns:
         '.pt.srt',
         '.en.vtt',
         '.pt.vtt',
-    ]
+    )
 
 
 # =============================================================================
@@ -233,6 +245,9 @@ class ValidationLimits:
     MAX_FILENAME_LENGTH: int = 255
     MAX_PATH_LENGTH: int = 4096
 
+    # URL length (request URLs and Referer/Origin headers)
+    MAX_URL_LENGTH: int = 2048
+
 
 # =============================================================================
 # Backward Compatibility Exports
@@ -4,7 +4,11 @@ Standardized error handling for the application.
 Provides consistent error codes, response models, and exception handlers
 for uniform API error responses.
 """
-from typing import Any, Optional
+import logging
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import orjson
 from pydantic import BaseModel
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
@@ -12,6 +16,7 @@ from fastapi.exceptions import RequestValidationError
 
 from app.core.logging import get_module_logger
 from app.core.request_context import get_request_id
+from app.core.types import ErrorPayload
 from app.config import settings
 
 logger = get_module_logger("errors")
@@ -101,6 +106,26 @@ class ErrorDetail(BaseModel):
     type: str
 
 
+class ErrorJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (error bodies bypass response_model)."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# (error_code, message) -> encoded body up to the request_id value. Errors with
+# a default message and no details reuse it; only request_id is encoded per call.
+_STATIC_ERROR_PREFIXES: Dict[Tuple[str, str], bytes] = {}
+
+
+def register_static_error(error_code: str, message: str) -> None:
+    """Pre-encode the body of a detail-less error with a fixed message."""
+    body = orjson.dumps({"error_code": error_code, "message": message, "details": None})
+    _STATIC_ERROR_PREFIXES[(error_code, message)] = body[:-1] + b',"request_id":'
+
+
 # =============================================================================
 # Custom Application Exception
 # =============================================================================
@@ -148,15 +173,19 @@ def create_error_response(
     Returns:
         JSONResponse with standardized error format
     """
-    response = JSONResponse(
-        status_code=status_code,
-        content=ErrorResponse(
-            error_code=error_code,
-            message=message,
-            details=details,
-            request_id=request_id,
-        ).model_dump(),
-    )
+    prefix = _STATIC_ERROR_PREFIXES.get((error_code, message)) if details is None else None
+    if prefix is not None:
+        content: Any = prefix + orjson.dumps(request_id) + b"}"
+    else:
+        # Same shape as ErrorResponse; built directly to skip model validation per error.
+        payload: ErrorPayload = {
+            "error_code": error_code,
+            "message": message,
+            "details": details,
+            "request_id": request_id,
+        }
+        content = payload
+    response = ErrorJSONResponse(status_code=status_code, content=content)
     if request_id:
         response.headers.setdefault("X-Request-Id", request_id)
     return response
@@ -192,13 +221,17 @@ def raise_error(
 # Exception Handlers
 # =============================================================================
 
+def _request_id_for(request: Request) -> Optional[str]:
+    return getattr(getattr(request, "state", None), "request_id", None) or get_request_id()
+
+
 async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
     """
     Handle AppException and return standardized error response.
     """
-    request_id = getattr(getattr(request, "state", None), "request_id", None) or get_request_id()
+    request_id = _request_id_for(request)
     logger.warning(
-        f"AppException: {exc.error_code} - {exc.message}",
+        "AppException: %s - %s", exc.error_code, exc.message,
         extra={"details": exc.details, "path": request.url.path, "request_id": request_id}
     )
 
@@ -211,26 +244,27 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     )
 
 
+# Map plain HTTPException status codes to error codes
+_HTTP_STATUS_TO_ERROR_CODE: Mapping[int, str] = MappingProxyType({
+    400: ErrorCode.INVALID_REQUEST,
+    401: ErrorCode.NOT_AUTHENTICATED,
+    403: ErrorCode.ACCESS_DENIED,
+    404: ErrorCode.NOT_FOUND,
+    416: ErrorCode.RANGE_NOT_SATISFIABLE,
+    429: ErrorCode.RATE_LIMIT_EXCEEDED,
+    500: ErrorCode.INTERNAL_ERROR,
+})
+
+
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """
     Handle standard HTTPException and return standardized error response.
     """
-    # Map status codes to error codes
-    error_code_map = {
-        400: ErrorCode.INVALID_REQUEST,
-        401: ErrorCode.NOT_AUTHENTICATED,
-        403: ErrorCode.ACCESS_DENIED,
-        404: ErrorCode.NOT_FOUND,
-        416: ErrorCode.RANGE_NOT_SATISFIABLE,
-        429: ErrorCode.RATE_LIMIT_EXCEEDED,
-        500: ErrorCode.INTERNAL_ERROR,
-    }
-
-    error_code = error_code_map.get(exc.status_code, ErrorCode.INTERNAL_ERROR)
-    request_id = getattr(getattr(request, "state", None), "request_id", None) or get_request_id()
+    error_code = _HTTP_STATUS_TO_ERROR_CODE.get(exc.status_code, ErrorCode.INTERNAL_ERROR)
+    request_id = _request_id_for(request)
 
     logger.warning(
-        f"HTTPException: {exc.status_code} - {exc.detail}",
+        "HTTPException: %s - %s", exc.status_code, exc.detail,
         extra={"path": request.url.path, "request_id": request_id}
     )
 
@@ -249,31 +283,29 @@ async def validation_exception_handler(
     """
     Handle Pydantic validation errors and return standardized error response.
     """
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"])
-        errors.append(ErrorDetail(
-            field=field,
-            message=error["msg"],
-            type=error["type"],
-        ).model_dump())
-
-    logger.warning(
-        f"Validation error: {len(errors)} errors",
-        extra={
-            "errors": errors,
-            "path": request.url.path,
-            "request_id": getattr(getattr(request, "state", None), "request_id", None)
-            or get_request_id(),
-        }
-    )
+    request_id = _request_id_for(request)
+    # Same fields as ErrorDetail, without a model instance per error
+    errors = [
+        {"field": ".".join(map(str, error["loc"])), "message": error["msg"], "type": error["type"]}
+        for error in exc.errors()
+    ]
+
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Validation error: %d errors", len(errors),
+            extra={
+                "errors": errors,
+                "path": request.url.path,
+                "request_id": request_id,
+            }
+        )
 
     return create_error_response(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        status_code=422,  # Unprocessable Content
         error_code=ErrorCode.VALIDATION_ERROR,
         message="Validation error in request",
         details={"errors": errors},
-        request_id=getattr(getattr(request, "state", None), "request_id", None) or get_request_id(),
+        request_id=request_id,
     )
 
 
@@ -281,9 +313,9 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     """
     Handle unexpected exceptions and return standardized error response.
     """
-    request_id = getattr(getattr(request, "state", None), "request_id", None) or get_request_id()
+    request_id = _request_id_for(request)
     logger.error(
-        f"Unhandled exception: {type(exc).__name__} - {exc}",
+        "Unhandled exception: %s - %s", type(exc).__name__, exc,
         exc_info=True,
         extra={"path": request.url.path, "request_id": request_id}
     )
@@ -292,11 +324,18 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         error_code=ErrorCode.INTERNAL_ERROR,
         message="An unexpected error occurred",
-        details={"type": type(exc).__name__} if logger.level <= 10 else None,  # DEBUG level
+        details={"type": type(exc).__name__} if logger.isEnabledFor(logging.DEBUG) else None,
         request_id=request_id,
     )
 
 
+for _code, _message in (
+    (ErrorCode.NOT_FOUND, "Not Found"),
+    (ErrorCode.INTERNAL_ERROR, "An unexpected error occurred"),
+):
+    register_static_error(_code, _message)
+
+
 # =============================================================================
 # Registration Function
 # =============================================================================
@@ -309,6 +348,11 @@ def register_exception_handlers(app) -> None:
         app: FastAPI application instance
     """
     app.add_exception_handler(AppException, app_exception_handler)
+    # Starlette walks type(exc).__mro__ until a registered class matches;
+    # registering the concrete subclasses (app.core.exceptions, loaded with
+    # the app.core package) makes the first lookup hit.
+    for exc_cls in AppException.__subclasses__():
+        app.add_exception_handler(exc_cls, app_exception_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     if settings.ENABLE_GENERIC_EXCEPTION_HANDLER:
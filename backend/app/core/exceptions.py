@@ -5,7 +5,7 @@ All exceptions use standardized error codes for consistent API responses.
 """
 from fastapi import status
 
-from .errors import AppException, ErrorCode
+from .errors import AppException, ErrorCode, register_static_error
 
 
 class VideoNotFoundException(AppException):
@@ -91,7 +91,7 @@ class RangeNotSatisfiableException(AppException):
     """Raised when a range request cannot be satisfied"""
     def __init__(self, detail: str = "Range not satisfiable", file_size: int = None):
         super().__init__(
-            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            status_code=416,  # Range Not Satisfiable
             error_code=ErrorCode.RANGE_NOT_SATISFIABLE,
             message=detail,
             details={"file_size": file_size} if file_size else None,
@@ -139,3 +139,23 @@ class PathTraversalException(AppException):
             error_code=ErrorCode.PATH_TRAVERSAL,
             message=detail,
         )
+
+
+# Pre-encode the default, detail-less error body of each exception above.
+# Keep in sync with the constructors' default messages.
+_STATIC_ERROR_DEFAULTS = (
+    (ErrorCode.VIDEO_NOT_FOUND, "Vídeo não encontrado"),
+    (ErrorCode.THUMBNAIL_NOT_FOUND, "Thumbnail não encontrada"),
+    (ErrorCode.JOB_NOT_FOUND, "Job não encontrado"),
+    (ErrorCode.ACCESS_DENIED, "Acesso negado"),
+    (ErrorCode.INVALID_REQUEST, "Requisição inválida"),
+    (ErrorCode.DRIVE_NOT_AUTHENTICATED, "Not authenticated with Google Drive"),
+    (ErrorCode.RANGE_NOT_SATISFIABLE, "Range not satisfiable"),
+    (ErrorCode.INVALID_RANGE_HEADER, "Invalid range header"),
+    (ErrorCode.DOWNLOAD_FAILED, "Download failed"),
+    (ErrorCode.UPLOAD_FAILED, "Upload failed"),
+    (ErrorCode.PATH_TRAVERSAL, "Path traversal not allowed"),
+)
+
+for _code, _message in _STATIC_ERROR_DEFAULTS:
+    register_static_error(_code, _message)
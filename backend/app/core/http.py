@@ -3,10 +3,13 @@ HTTP helpers with retry/backoff for idempotent requests.
 """
 from __future__ import annotations
 
+import functools
 import time
-from typing import Iterable, Optional
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from fastapi.responses import Response
 
 from app.core.logging import get_module_logger
@@ -14,7 +17,20 @@ from app.core.logging import get_module_logger
 logger = get_module_logger("core.http")
 
 
-DEFAULT_RETRY_STATUSES = {429, 500, 502, 503, 504}
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+
+def _build_session() -> requests.Session:
+    # Retries are handled by request_with_retry, not urllib3.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across worker threads so Drive calls reuse keep-alive TCP/TLS connections.
+_SESSION = _build_session()
 
 
 def request_with_retry(
@@ -31,35 +47,26 @@ def request_with_retry(
 ) -> requests.Response:
     method_upper = method.upper()
     retryable = method_upper == "GET" and not stream
-    retry_statuses_set = set(retry_statuses or DEFAULT_RETRY_STATUSES)
+    retry_statuses_set = frozenset(retry_statuses) if retry_statuses else DEFAULT_RETRY_STATUSES
 
     attempt = 0
     while True:
         try:
-            if method_upper == "GET":
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    stream=stream,
-                    timeout=timeout,
-                )
-            else:
-                response = requests.request(
-                    method_upper,
-                    url,
-                    headers=headers,
-                    params=params,
-                    stream=stream,
-                    timeout=timeout,
-                )
+            response = _SESSION.request(
+                method_upper,
+                url,
+                headers=headers,
+                params=params,
+                stream=stream,
+                timeout=timeout,
+            )
             if (
                 retryable
                 and response.status_code in retry_statuses_set
                 and attempt < retries
             ):
                 response.close()
-                sleep_for = backoff * (2**attempt)
+                sleep_for = backoff * (1 << attempt)
                 logger.warning(
                     "HTTP %s retry %s/%s for %s (status %s)",
                     method_upper,
@@ -75,7 +82,7 @@ def request_with_retry(
         except requests.RequestException as exc:
             if attempt >= retries:
                 raise
-            sleep_for = backoff * (2**attempt)
+            sleep_for = backoff * (1 << attempt)
             logger.warning(
                 "HTTP %s retry %s/%s for %s (error: %s)",
                 method_upper,
@@ -88,6 +95,12 @@ def request_with_retry(
             attempt += 1
 
 
+@functools.lru_cache(maxsize=16)
+def _cache_headers(max_age: int) -> Mapping[str, str]:
+    # Response copies headers into its own raw list, so sharing is safe.
+    return MappingProxyType({"Cache-Control": f"public, max-age={max_age}"})
+
+
 def build_cache_response(
     content: bytes,
     media_type: str,
@@ -97,5 +110,5 @@ def build_cache_response(
     return Response(
         content=content,
         media_type=media_type,
-        headers={"Cache-Control": f"public, max-age={max_age}"},
+        headers=_cache_headers(max_age),
     )
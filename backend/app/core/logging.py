@@ -14,6 +14,8 @@ import logging
 import sys
 from typing import Optional
 
+import orjson
+
 from app.core.request_context import get_request_id
 
 
@@ -23,7 +25,24 @@ class _RequestIdFilter(logging.Filter):
         return True
 
 
-class _JsonFormatter(logging.Formatter):
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second."""
+
+    _time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if cached_second != second:
+            cached_text = super().formatTime(record, datefmt)
+            # Single tuple assignment keeps the pair consistent across threads.
+            self._time_cache = (second, cached_text)
+        return cached_text
+
+
+class _JsonFormatter(_CachedTimeFormatter):
     def format(self, record: logging.LogRecord) -> str:
         payload = {
             "timestamp": self.formatTime(record, self.datefmt),
@@ -34,7 +53,12 @@ class _JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=True)
+        try:
+            return orjson.dumps(payload).decode()
+        except TypeError:
+            # orjson rejects lone surrogates (undecodable filenames from
+            # os.walk/os.scandir); the stdlib encoder escapes them instead.
+            return json.dumps(payload, ensure_ascii=True, default=str)
 
 
 def setup_logging(
@@ -69,7 +93,7 @@ def setup_logging(
     elif log_format == "pretty":
         formatter = _PrettyFormatter(datefmt="%Y-%m-%d %H:%M:%S", use_color=color_enabled)
     else:
-        formatter = logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
+        formatter = _CachedTimeFormatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
@@ -116,7 +140,7 @@ def get_module_logger(module: str) -> logging.Logger:
     return get_logger(module)
 
 
-class _PrettyFormatter(logging.Formatter):
+class _PrettyFormatter(_CachedTimeFormatter):
     _LEVEL_COLORS = {
         logging.DEBUG: "\033[36m",
         logging.INFO: "\033[32m",
@@ -130,22 +154,32 @@ class _PrettyFormatter(logging.Formatter):
     def __init__(self, datefmt: Optional[str] = None, use_color: bool = True):
         super().__init__(datefmt=datefmt)
         self.use_color = use_color
+        # Padded (and colored) level column for the standard levels
+        if use_color:
+            self._level_text = {
+                level: f"{color}{logging.getLevelName(level):<8}{self._RESET}"
+                for level, color in self._LEVEL_COLORS.items()
+            }
+        else:
+            self._level_text = {
+                level: f"{logging.getLevelName(level):<8}" for level in self._LEVEL_COLORS
+            }
 
     def format(self, record: logging.LogRecord) -> str:
         timestamp = self.formatTime(record, self.datefmt)
-        level_name = record.levelname
+        level_text = self._level_text.get(record.levelno)
         location = f"{record.name}:{record.funcName}:{record.lineno}"
         request_id = getattr(record, "request_id", "-")
         message = record.getMessage()
 
+        if level_text is None:
+            level_text = f"{record.levelname:<8}"
+
         if self.use_color:
-            level_color = self._LEVEL_COLORS.get(record.levelno, "")
-            level_text = f"{level_color}{level_name:<8}{self._RESET}"
             time_text = f"{self._DIM}{timestamp}{self._RESET}"
             location_text = f"{self._DIM}{location}{self._RESET}"
             request_text = f"{self._DIM}req:{request_id}{self._RESET}"
         else:
-            level_text = f"{level_name:<8}"
             time_text = timestamp
             location_text = location
             request_text = f"req:{request_id}"
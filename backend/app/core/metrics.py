@@ -3,6 +3,8 @@ Prometheus metrics helpers.
 """
 from __future__ import annotations
 
+from typing import Dict, Tuple
+
 from prometheus_client import Counter, Gauge, Histogram
 
 REQUEST_COUNT = Counter(
@@ -15,9 +17,44 @@ REQUEST_LATENCY = Histogram(
     "yt_archiver_http_request_duration_seconds",
     "HTTP request latency in seconds",
     ["method", "path"],
-    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    # Kept coarse on purpose: every bucket is a series per (method, path).
+    buckets=(0.01, 0.05, 0.25, 1, 2.5, 10),
 )
 
+# Bound label children, keyed by label values. Paths are route templates, so
+# these stay small and spare the per-request `.labels()` lookup.
+_REQUEST_COUNT_CHILDREN: Dict[Tuple[str, str, int], Counter] = {}
+_REQUEST_LATENCY_CHILDREN: Dict[Tuple[str, str], Histogram] = {}
+
+
+_STATUS_STR: Dict[int, str] = {
+    code: str(code)
+    for code in (200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 409, 422, 429, 500, 502, 503, 504)
+}
+
+
+def status_label(status_code: int) -> str:
+    return _STATUS_STR.get(status_code) or str(status_code)
+
+
+def get_request_counter(method: str, path: str, status_code: int) -> Counter:
+    key = (method, path, status_code)
+    child = _REQUEST_COUNT_CHILDREN.get(key)
+    if child is None:
+        child = _REQUEST_COUNT_CHILDREN[key] = REQUEST_COUNT.labels(
+            method, path, status_label(status_code)
+        )
+    return child
+
+
+def get_request_latency(method: str, path: str) -> Histogram:
+    key = (method, path)
+    child = _REQUEST_LATENCY_CHILDREN.get(key)
+    if child is None:
+        child = _REQUEST_LATENCY_CHILDREN[key] = REQUEST_LATENCY.labels(method, path)
+    return child
+
+
 DOWNLOAD_REQUESTS = Counter(
     "yt_archiver_download_requests_total",
     "Download requests accepted via API",
@@ -31,7 +68,8 @@ VIDEO_INFO_REQUESTS = Counter(
 VIDEO_INFO_LATENCY = Histogram(
     "yt_archiver_video_info_duration_seconds",
     "Video info request duration in seconds",
-    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    # Dominated by upstream round trips; finer buckets add series, not insight.
+    buckets=(0.1, 0.5, 2.5, 10),
 )
 
 DOWNLOAD_JOBS_STARTED = Counter(
@@ -1,31 +1,73 @@
 """
 Metrics middleware for Prometheus.
+
+The `path` label holds the matched route template (e.g. `/jobs/{job_id}`)
+rather than the raw URL, so series count stays bounded by the number of
+routes. Requests that match no route are labelled `unmatched`.
 """
 from __future__ import annotations
 
+import sys
 import time
-from typing import Callable
+from typing import Optional
+
+from app.core.metrics import get_request_counter, get_request_latency
+
+UNMATCHED_PATH = "unmatched"
+OTHER_PATH = "other"
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path or UNMATCHED_PATH
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 
-from app.core.metrics import REQUEST_COUNT, REQUEST_LATENCY
+class MetricsMiddleware:
+    def __init__(
+        self,
+        app,
+        *,
+        exclude_paths: set[str] | None = None,
+        path_allowlist: Optional[set[str]] = None,
+    ) -> None:
+        self.app = app
+        # Matched against route templates, not raw URLs. Scrape and probe
+        # routes (`/metrics`, `/api/health`) belong here so polling them does
+        # not add series of its own.
+        self._exclude_paths = frozenset(sys.intern(p) for p in (exclude_paths or ()))
+        self._path_allowlist = path_allowlist
 
+    def _label_for(self, template: str) -> str:
+        if (
+            self._path_allowlist is not None
+            and template != UNMATCHED_PATH
+            and template not in self._path_allowlist
+        ):
+            return OTHER_PATH
+        return template
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, *, exclude_paths: set[str] | None = None) -> None:
-        super().__init__(app)
-        self._exclude_paths = exclude_paths or set()
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        path = request.url.path
-        if path in self._exclude_paths:
-            return await call_next(request)
+        status_code = 500
 
-        start = time.perf_counter()
-        response = await call_next(request)
-        duration = time.perf_counter() - start
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        REQUEST_COUNT.labels(request.method, path, str(response.status_code)).inc()
-        REQUEST_LATENCY.labels(request.method, path).observe(duration)
-        return response
+        start = time.perf_counter_ns()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start
+            template = _route_template(scope)
+            if template not in self._exclude_paths:
+                path = self._label_for(template)
+                method = scope["method"]
+                get_request_counter(method, path, status_code).inc()
+                get_request_latency(method, path).observe(elapsed_ns / 1e9)
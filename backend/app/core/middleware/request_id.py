@@ -2,19 +2,24 @@
 Request ID middleware.
 
 - Accepts inbound `X-Request-Id` (if provided by the client).
-- Otherwise generates a UUID4.
+- Otherwise generates an opaque 32-char hex id (128 random bits); pass
+  `generator` for RFC 4122 UUIDs instead.
 - Stores it in `request.state.request_id` and in a ContextVar.
 - Always returns `X-Request-Id` in the response.
 """
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from typing import Callable, Optional
 
 from app.core.request_context import reset_request_id, set_request_id
 
 
+def _generate_request_id() -> str:
+    return secrets.token_hex(16)
+
+
 class RequestIdMiddleware:
     def __init__(
         self,
@@ -25,16 +30,17 @@ class RequestIdMiddleware:
         self.app = app
         self.header_name = header_name
         self._header_name_bytes = header_name.lower().encode("latin-1")
-        self.generator = generator or (lambda: str(uuid.uuid4()))
+        self.generator = generator or _generate_request_id
 
     async def __call__(self, scope, receive, send) -> None:
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
+        header_name = self._header_name_bytes
         request_id = None
         for key, value in scope.get("headers", []):
-            if key == self._header_name_bytes:
+            if key == header_name:
                 try:
                     request_id = value.decode("utf-8", errors="replace").strip() or None
                 except Exception:
@@ -49,11 +55,17 @@ class RequestIdMiddleware:
         scope.setdefault("state", {})
         scope["state"]["request_id"] = request_id
 
+        header_pair = (header_name, request_id.encode("utf-8"))
+
         async def send_wrapper(message) -> None:
             if message["type"] == "http.response.start":
-                headers = list(message.get("headers", []))
-                if not any(key == self._header_name_bytes for key, _ in headers):
-                    headers.append((self._header_name_bytes, request_id.encode("utf-8")))
+                headers = list(message.get("headers", ()))
+                # Error responses already carry the header (see create_error_response).
+                for key, _ in headers:
+                    if key == header_name:
+                        break
+                else:
+                    headers.append(header_pair)
                 message["headers"] = headers
             await send(message)
 
@@ -7,8 +7,10 @@ encoding used across the backend.
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
-from urllib.parse import quote, unquote
+from urllib.parse import unquote
 
 from app.core.exceptions import AccessDeniedException, VideoNotFoundException
 
@@ -18,9 +20,22 @@ def decode_url_path(path: str) -> str:
     return unquote(path) if path else ""
 
 
+# Same escaping as `urllib.parse.quote(filename)` (safe="/"), precomputed per byte.
+_RFC5987_SAFE = frozenset(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/"
+)
+_RFC5987_SAFE_BYTES = bytes(sorted(_RFC5987_SAFE))
+_RFC5987_TABLE = tuple(
+    chr(byte) if byte in _RFC5987_SAFE else f"%{byte:02X}" for byte in range(256)
+)
+
+
 def encode_filename_rfc5987(filename: str) -> str:
     """Encode a filename for use in HTTP headers (RFC 5987)."""
-    return quote(filename)
+    data = filename.encode("utf-8")
+    if not data.rstrip(_RFC5987_SAFE_BYTES):
+        return filename
+    return "".join(map(_RFC5987_TABLE.__getitem__, data))
 
 
 def ensure_relative_path(target_path: str) -> Path:
@@ -36,6 +51,17 @@ def ensure_relative_path(target_path: str) -> Path:
     return path
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_base_dir(base_dir: Path) -> Path:
+    # Only for trusted base directories; user-supplied paths are always resolved fresh.
+    return base_dir.resolve()
+
+
+def clear_path_caches() -> None:
+    """Forget cached base directory resolutions (e.g. after a base dir is relinked)."""
+    _resolve_base_dir.cache_clear()
+
+
 def ensure_within_base(file_path: Path, base_dir: Path) -> None:
     """
     Validate that file_path is contained within base_dir.
@@ -45,12 +71,12 @@ def ensure_within_base(file_path: Path, base_dir: Path) -> None:
     """
     try:
         resolved_path = file_path.resolve()
-        resolved_base = base_dir.resolve()
+        resolved_base = _resolve_base_dir(base_dir)
 
-        try:
-            # Python 3.9+
-            resolved_path.relative_to(resolved_base)
-        except Exception:
+        resolved_str = os.fspath(resolved_path)
+        base_str = os.fspath(resolved_base)
+        prefix = base_str if base_str.endswith(os.sep) else base_str + os.sep
+        if resolved_str != base_str and not resolved_str.startswith(prefix):
             raise AccessDeniedException()
     except Exception as e:
         if isinstance(e, AccessDeniedException):
@@ -9,9 +9,12 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from app.core.errors import ErrorCode, ErrorResponse
+from app.core.errors import ErrorCode, create_error_response
 from app.core.request_context import get_request_id
 
+_FORWARDED_FOR_HEADER = "x-forwarded-for"
+_REAL_IP_HEADER = "x-real-ip"
+
 
 def get_client_ip(request: Request) -> str:
     """
@@ -20,13 +23,14 @@ def get_client_ip(request: Request) -> str:
     Handles proxy headers (X-Forwarded-For) for accurate IP detection.
     """
     # Check for proxy headers first
-    forwarded = request.headers.get("X-Forwarded-For")
+    forwarded = request.headers.get(_FORWARDED_FOR_HEADER)
     if forwarded:
         # X-Forwarded-For can contain multiple IPs, take the first one
-        return forwarded.split(",")[0].strip()
+        head, _, _ = forwarded.partition(",")
+        return head.strip()
 
     # Check for real IP header (used by some proxies)
-    real_ip = request.headers.get("X-Real-IP")
+    real_ip = request.headers.get(_REAL_IP_HEADER)
     if real_ip:
         return real_ip
 
@@ -45,23 +49,22 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSO
     Returns a standardized error response.
     """
     # Extract limit info from the exception
-    retry_after = exc.detail.split("per ")[1] if "per " in exc.detail else "later"
+    _, sep, tail = exc.detail.partition("per ")
+    retry_after = tail if sep else "later"
     request_id = getattr(getattr(request, "state", None), "request_id", None) or get_request_id()
 
-    return JSONResponse(
+    response = create_error_response(
         status_code=429,
-        content=ErrorResponse(
-            error_code=ErrorCode.RATE_LIMIT_EXCEEDED,
-            message="Too many requests. Please slow down.",
-            details={
-                "limit": exc.detail,
-                "retry_after": retry_after,
-            }
-            ,
-            request_id=request_id,
-        ).model_dump(),
-        headers={"Retry-After": retry_after, "X-Request-Id": request_id} if request_id else {"Retry-After": retry_after},
+        error_code=ErrorCode.RATE_LIMIT_EXCEEDED,
+        message="Too many requests. Please slow down.",
+        details={
+            "limit": exc.detail,
+            "retry_after": retry_after,
+        },
+        request_id=request_id,
     )
+    response.headers["Retry-After"] = retry_after
+    return response
 
 
 # =============================================================================
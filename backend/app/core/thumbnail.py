@@ -4,10 +4,14 @@ Thumbnail generation utilities using ffmpeg.
 This module provides functions to automatically generate video thumbnails
 from video files using ffmpeg.
 """
+import functools
+import logging
+import os
 import subprocess
 import shutil
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
 
 from app.core.logging import get_module_logger
 from app.core.constants import FileExtensions
@@ -81,54 +85,59 @@ def calculate_thumbnail_timestamp(duration: Optional[float]) -> float:
     return timestamp
 
 
-def generate_thumbnail(
-    video_path: Path,
-    output_path: Optional[Path] = None,
-    timestamp: Optional[float] = None,
-    width: int = 1280,
-    quality: int = 2
-) -> Optional[Path]:
-    """
-    Generate a thumbnail from a video file using ffmpeg.
-
-    The thumbnail is extracted as a single frame from the video and saved
-    as a JPEG image. The default timestamp is calculated to avoid black
-    intro screens (typically 10% into the video).
+# Leading bytes expected for containers whose extension we recognise.
+_ISO_BMFF_BOXES = (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip")
+_EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+_ISO_BMFF_EXTENSIONS = frozenset({".mp4", ".m4v", ".mov"})
+_MATROSKA_EXTENSIONS = frozenset({".mkv", ".webm"})
 
-    Args:
-        video_path: Path to the video file
-        output_path: Output path for thumbnail. If None, uses video name with .jpg extension
-        timestamp: Specific timestamp in seconds. If None, auto-calculated
-        width: Output width in pixels (height auto-calculated to maintain aspect ratio)
-        quality: JPEG quality (2-31, lower is better, 2 is highest quality)
 
-    Returns:
-        Path to the generated thumbnail, or None if generation failed
+def _is_playable_container(video_path: Path) -> bool:
+    """
+    Cheap header check before spawning ffmpeg.
 
-    Example:
-        >>> thumbnail = generate_thumbnail(Path("video.mp4"))
-        >>> print(thumbnail)  # video.jpg
+    Only MP4/QuickTime and Matroska/WebM files are inspected; a file with one of
+    those extensions whose header does not match (e.g. a truncated partial
+    download) is rejected. Anything else is left for ffmpeg to decide.
     """
-    if not is_ffmpeg_available():
-        logger.error("ffmpeg not available on system")
-        return None
+    ext = video_path.suffix.lower()
+    if ext not in _ISO_BMFF_EXTENSIONS and ext not in _MATROSKA_EXTENSIONS:
+        return True
 
-    if not video_path.exists():
-        logger.error(f"Video file not found: {video_path}")
-        return None
+    try:
+        with open(video_path, "rb") as handle:
+            header = handle.read(64)
+    except OSError:
+        return False
+
+    if ext in _MATROSKA_EXTENSIONS:
+        return header.startswith(_EBML_MAGIC)
+    return header[4:8] in _ISO_BMFF_BOXES
 
-    # Determine output path
-    if output_path is None:
-        output_path = video_path.with_suffix(".jpg")
 
-    # Calculate timestamp if not provided
-    if timestamp is None:
-        duration = get_video_duration(video_path)
-        timestamp = calculate_thumbnail_timestamp(duration)
+def _extract_frame(
+    video_path: Path,
+    output_path: Path,
+    timestamp: float,
+    width: int,
+    quality: int,
+    miss_level: int = logging.WARNING,
+) -> Optional[Path]:
+    """
+    Run ffmpeg to grab a single frame; returns the output path or None.
 
+    A pre-existing file at ``output_path`` only counts if ffmpeg rewrote it,
+    so a stale thumbnail is never reported as freshly generated. Failures are
+    logged at ``miss_level``.
+    """
     logger.debug(f"Generating thumbnail for {video_path.name} at {timestamp:.1f}s")
 
     try:
+        try:
+            before = output_path.stat()
+        except FileNotFoundError:
+            before = None
+
         # ffmpeg command:
         # -ss: seek to timestamp (before -i for faster seeking)
         # -i: input file
@@ -153,16 +162,24 @@ def generate_thumbnail(
         )
 
         if result.returncode != 0:
-            logger.warning(f"ffmpeg failed: {result.stderr[:500]}")
+            logger.log(miss_level, f"ffmpeg failed: {result.stderr[:500]}")
             return None
 
-        if not output_path.exists():
-            logger.warning(f"Thumbnail file was not created: {output_path}")
+        try:
+            after = output_path.stat()
+        except FileNotFoundError:
+            after = None
+        if after is None or (
+            before is not None
+            and (after.st_mtime_ns, after.st_size, after.st_ino)
+            == (before.st_mtime_ns, before.st_size, before.st_ino)
+        ):
+            logger.log(miss_level, f"Thumbnail file was not created: {output_path}")
             return None
 
         # Verify file is not empty
-        if output_path.stat().st_size < 100:
-            logger.warning(f"Thumbnail file is too small, likely invalid: {output_path}")
+        if after.st_size < 100:
+            logger.log(miss_level, f"Thumbnail file is too small, likely invalid: {output_path}")
             output_path.unlink()
             return None
 
@@ -177,12 +194,117 @@ def generate_thumbnail(
         return None
 
 
+def generate_thumbnail(
+    video_path: Path,
+    output_path: Optional[Path] = None,
+    timestamp: Optional[float] = None,
+    width: int = 1280,
+    quality: int = 2,
+    accurate: bool = False,
+) -> Optional[Path]:
+    """
+    Generate a thumbnail from a video file using ffmpeg.
+
+    The thumbnail is extracted as a single frame from the video and saved
+    as a JPEG image. By default the frame is taken at a fixed offset without
+    probing the video; if that yields no frame (e.g. a very short clip), the
+    duration is probed and extraction retried at 10% into the video.
+
+    Args:
+        video_path: Path to the video file
+        output_path: Output path for thumbnail. If None, uses video name with .jpg extension
+        timestamp: Specific timestamp in seconds. If None, auto-calculated
+        width: Output width in pixels (height auto-calculated to maintain aspect ratio)
+        quality: JPEG quality (2-31, lower is better, 2 is highest quality)
+        accurate: Probe the duration with ffprobe up front instead of using the fixed offset
+
+    Returns:
+        Path to the generated thumbnail, or None if generation failed
+
+    Example:
+        >>> thumbnail = generate_thumbnail(Path("video.mp4"))
+        >>> print(thumbnail)  # video.jpg
+    """
+    if not is_ffmpeg_available():
+        logger.error("ffmpeg not available on system")
+        return None
+
+    if not video_path.exists():
+        logger.error(f"Video file not found: {video_path}")
+        return None
+
+    if not _is_playable_container(video_path):
+        logger.warning(f"Skipping thumbnail, unrecognised container header: {video_path.name}")
+        return None
+
+    # Determine output path
+    if output_path is None:
+        output_path = video_path.with_suffix(".jpg")
+
+    if timestamp is not None:
+        return _extract_frame(video_path, output_path, timestamp, width, quality)
+
+    if not accurate:
+        # A miss here is expected for clips shorter than the fixed offset.
+        thumbnail = _extract_frame(
+            video_path,
+            output_path,
+            calculate_thumbnail_timestamp(None),
+            width,
+            quality,
+            miss_level=logging.DEBUG,
+        )
+        if thumbnail:
+            return thumbnail
+
+    duration = get_video_duration(video_path)
+    if duration is None and not accurate:
+        # Would land on the same fixed offset that just failed.
+        return None
+    timestamp = calculate_thumbnail_timestamp(duration)
+    return _extract_frame(video_path, output_path, timestamp, width, quality)
+
+
+# Directories modified this recently are listed fresh rather than cached, since
+# a further change within the filesystem's timestamp granularity would not
+# move st_mtime_ns.
+_DIR_INDEX_MIN_AGE_NS = 2_000_000_000
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_dir_index(parent_dir: str, mtime_ns: int) -> FrozenSet[str]:
+    return _dir_index(parent_dir)
+
+
+def _dir_index(parent_dir: str) -> FrozenSet[str]:
+    # is_file() follows symlinks, so directories and dangling links are left
+    # out just as Path.exists()/is_file() checks would.
+    with os.scandir(parent_dir) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+def _list_dir_names(parent_dir: str) -> FrozenSet[str]:
+    try:
+        mtime_ns = os.stat(parent_dir).st_mtime_ns
+        if time.time_ns() - mtime_ns < _DIR_INDEX_MIN_AGE_NS:
+            return _dir_index(parent_dir)
+        return _cached_dir_index(parent_dir, mtime_ns)
+    except OSError:
+        return frozenset()
+
+
+def clear_thumbnail_cache() -> None:
+    """Drop cached directory listings used by find_existing_thumbnail."""
+    _cached_dir_index.cache_clear()
+
+
 def find_existing_thumbnail(video_path: Path) -> Optional[Path]:
     """
     Find an existing thumbnail for a video file.
 
     Searches for files with the same base name but image extensions
-    (.jpg, .jpeg, .png, .webp) in the same directory.
+    (.jpg, .jpeg, .png, .webp) in the same directory. The directory is read
+    once and its listing reused until its mtime changes.
 
     Args:
         video_path: Path to the video file
@@ -192,11 +314,12 @@ def find_existing_thumbnail(video_path: Path) -> Optional[Path]:
     """
     base_name = video_path.stem
     parent_dir = video_path.parent
+    names = _list_dir_names(os.fspath(parent_dir))
 
     for ext in FileExtensions.THUMBNAIL:
-        thumbnail_path = parent_dir / f"{base_name}{ext}"
-        if thumbnail_path.exists():
-            return thumbnail_path
+        name = f"{base_name}{ext}"
+        if name in names:
+            return parent_dir / name
 
     return None
 
@@ -153,6 +153,15 @@ class ErrorDetail(TypedDict, total=False):
     details: Optional[Any]
 
 
+class ErrorPayload(TypedDict):
+    """Type definition for the standardized error response body."""
+
+    error_code: str
+    message: str
+    details: Optional[Any]
+    request_id: Optional[str]
+
+
 # =============================================================================
 # Cache Types
 # =============================================================================
@@ -1,9 +1,10 @@
 """
 Upload helpers for validating and reading incoming files.
 """
+import os
 import shutil
 from pathlib import Path
-from typing import Sequence, Tuple
+from typing import BinaryIO, Sequence, Tuple
 
 from fastapi import UploadFile
 
@@ -27,6 +28,42 @@ async def read_thumbnail_upload(
     return thumbnail_data, file_ext
 
 
+_COPY_BUFFER_SIZE = 1024 * 1024
+_COPY_CHUNK_SIZE = 1 << 30
+
+
+def _fast_copy(src: BinaryIO, dst: BinaryIO) -> None:
+    """
+    Copy src into dst, in kernel space when both are real files.
+
+    Spooled uploads still held in memory are copied with a large buffer instead
+    of being rolled over to disk first.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None and getattr(src, "_rolled", True):
+        try:
+            src.flush()
+            src_fd = src.fileno()
+            dst_fd = dst.fileno()
+            offset = src.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+        else:
+            try:
+                while True:
+                    copied = copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE, offset_src=offset)
+                    if not copied:
+                        break
+                    offset += copied
+                src.seek(offset)
+                return
+            except OSError:
+                # Unsupported here (filesystem, kernel); finish in user space
+                # from wherever the kernel copy stopped.
+                src.seek(offset)
+    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+
 def save_upload_file(upload: UploadFile, destination: Path) -> None:
     with open(destination, "wb") as handle:
-        shutil.copyfileobj(upload.file, handle)
+        _fast_copy(upload.file, handle)
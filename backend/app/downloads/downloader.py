@@ -3,6 +3,8 @@ Módulo para gerenciar downloads usando yt-dlp.
 Versão standalone para uso na API, sem dependências do main.py.
 """
 from __future__ import annotations
+import asyncio
+import functools
 import os
 import time
 import random
@@ -10,8 +12,9 @@ import pathlib
 import threading
 import urllib.parse as urlparse
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from yt_dlp import YoutubeDL
 
 
@@ -38,8 +41,14 @@ MEDIA_EXTS = {
 FORMAT_SUFFIX_RE = re.compile(r"^\.f\d+$", re.IGNORECASE)
 TEMP_SUFFIXES = {".part", ".ytdl", ".temp"}
 
+# Cache de metadados para /api/video-info (apenas respostas com sucesso)
+VIDEO_INFO_CACHE_TTL = 300.0
+VIDEO_INFO_CACHE_MAX = 512
+_video_info_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+_video_info_lock = threading.Lock()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Configurações de download"""
     out_dir: str
@@ -75,6 +84,7 @@ class Settings:
     randomize_delay: bool = False  # Randomizar delays para parecer humano
 
 
+@functools.lru_cache(maxsize=32)
 def _build_format(fmt: str, max_res: Optional[int]) -> str:
     """Constrói string de formato para yt-dlp"""
     if max_res:
@@ -84,21 +94,39 @@ def _build_format(fmt: str, max_res: Optional[int]) -> str:
 
 def _outtmpl(s: Settings) -> str:
     """Gera template de saída para yt-dlp"""
-    if s.custom_path or s.file_name:
+    return _build_outtmpl(s.out_dir, s.custom_path, s.file_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_outtmpl(out_dir: str, custom_path: Optional[str], file_name: Optional[str]) -> str:
+    if custom_path or file_name:
         base_dir = (
-            os.path.join(s.out_dir, s.custom_path) if s.custom_path else s.out_dir
+            os.path.join(out_dir, custom_path) if custom_path else out_dir
         )
         name_tmpl = (
-            (s.file_name.strip() + ".%(ext)s")
-            if s.file_name
+            (file_name.strip() + ".%(ext)s")
+            if file_name
             else "%(title).180B.%(ext)s"
         )
         return os.path.join(base_dir, name_tmpl)
-    return DEFAULT_TEMPLATE.format(out=s.out_dir)
+    return DEFAULT_TEMPLATE.format(out=out_dir)
 
 
 def _base_opts(s: Settings) -> dict:
     """Configurações base do yt-dlp"""
+    # O YoutubeDL altera os params recebidos; cada chamada recebe cópias
+    # próprias das partes mutáveis do template em cache.
+    opts = _cached_base_opts(s)
+    return {
+        **opts,
+        "subtitleslangs": list(opts["subtitleslangs"]),
+        "postprocessors": [dict(pp) for pp in opts["postprocessors"]],
+        "http_headers": dict(opts["http_headers"]),
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_base_opts(s: Settings) -> dict:
     postprocessors = []
     if s.audio_only:
         postprocessors.append(
@@ -252,7 +280,11 @@ def _resolve_existing_media_path(ydl: YoutubeDL, info: dict) -> Optional[str]:
 
 def _extract_entries(url: str, limit: Optional[int]) -> list[str]:
     """Extrai URLs de uma playlist ou retorna URL única"""
-    with YoutubeDL({"quiet": True, "extract_flat": True}) as ydl:
+    opts: dict = {"quiet": True, "extract_flat": True}
+    if limit:
+        # yt-dlp pagina a playlist sob demanda: para após `limit` entradas
+        opts["playlistend"] = limit
+    with YoutubeDL(opts) as ydl:
         info = ydl.extract_info(url, download=False)
 
     urls: list[str] = []
@@ -276,15 +308,20 @@ def _extract_entries(url: str, limit: Optional[int]) -> list[str]:
     return urls
 
 
-def _custom_archive_has(path: str, key: str) -> bool:
-    """Verifica se uma entrada existe no arquivo de archive customizado"""
-    if not key or not os.path.exists(path):
-        return False
+def _load_custom_archive(path: str) -> set[str]:
+    """Carrega as chaves do arquivo de archive customizado"""
+    if not os.path.exists(path):
+        return set()
     try:
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return any(ln.strip() == f"custom {key}" for ln in f)
+            keys: set[str] = set()
+            for ln in f:
+                ln = ln.strip()
+                if ln.startswith("custom "):
+                    keys.add(ln[7:])
+            return keys
     except Exception:
-        return False
+        return set()
 
 
 def _custom_archive_add(path: str, key: str) -> None:
@@ -305,9 +342,12 @@ class DownloadProgress:
         self.total_files = 0
         self.current_index = 0
 
-        # Throttling: só atualizar a cada X%
-        self.last_percentage = 0
+        # Throttling: só atualizar a cada X% (comparação inteira em bytes)
         self.update_threshold = 2  # Atualizar a cada 2% de mudança
+        self._last_bytes: Optional[int] = 0
+        # Sem tamanho total conhecido: no máximo um update por intervalo
+        self.unknown_total_interval_ns = 250_000_000
+        self._last_ns = 0
 
     def __call__(self, d):
         if not self.on_progress:
@@ -319,16 +359,19 @@ class DownloadProgress:
             downloaded = d.get("downloaded_bytes", 0)
             total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
 
-            # Calcular porcentagem apenas uma vez
             if total > 0:
-                percentage = (downloaded / total * 100)
-
                 # Throttling: só atualizar se mudou significativamente
-                if abs(percentage - self.last_percentage) < self.update_threshold:
+                last = self._last_bytes
+                if last is not None and abs(downloaded - last) * 100 < total * self.update_threshold:
                     return  # Pular este update
 
-                self.last_percentage = percentage
+                self._last_bytes = downloaded
+                percentage = (downloaded / total * 100)
             else:
+                now = time.monotonic_ns()
+                if now - self._last_ns < self.unknown_total_interval_ns:
+                    return
+                self._last_ns = now
                 percentage = 0
 
             # Cache do basename (evita chamar toda vez)
@@ -349,8 +392,9 @@ class DownloadProgress:
             self.on_progress(progress_data)
 
         elif status == "finished":
-            # Sempre reportar finished
-            self.last_percentage = 100
+            # Sempre reportar finished; o próximo arquivo começa sem throttling
+            self._last_bytes = None
+            self._last_ns = 0
             self.on_progress({
                 "status": "finished",
                 "filename": os.path.basename(d.get("filename", "")),
@@ -358,7 +402,108 @@ class DownloadProgress:
             })
 
 
-def download_video(
+def _download_entry(ydl: YoutubeDL, video_url: str, settings: Settings) -> Tuple[Optional[dict], Optional[dict]]:
+    """
+    Baixa uma entrada da playlist (bloqueante, roda em thread).
+
+    Returns:
+        (resultado da entrada, erro fatal que encerra o download)
+    """
+    info = ydl.extract_info(video_url, download=False)
+
+    if not info:
+        return {
+            "url": video_url,
+            "status": "error",
+            "message": "Falha ao obter metadados do vídeo",
+        }, None
+
+    conflict = _detect_conflict(ydl, info)
+    if conflict:
+        rel_path = str(conflict)
+        try:
+            rel_path = str(conflict.resolve().relative_to(pathlib.Path(settings.out_dir).resolve()))
+        except Exception:
+            rel_path = str(conflict)
+        return None, {
+            "status": "error",
+            "error": f"Arquivo já existe no destino: {rel_path}",
+        }
+
+    info = ydl.extract_info(video_url, download=True)
+    if not info:
+        return None, None
+
+    output_path = _resolve_existing_media_path(ydl, info) or _resolve_output_path(ydl, info)
+
+    # Adicionar ao arquivo de archive
+    if settings.archive_id:
+        _custom_archive_add(settings.archive_file, settings.archive_id)
+
+    return {
+        "url": video_url,
+        "status": "success",
+        "title": info.get("title"),
+        "id": info.get("id"),
+        "duration": info.get("duration"),
+        "filepath": output_path,
+    }, None
+
+
+def _can_download_in_parallel(settings: Settings, n_entries: int) -> bool:
+    """Paralelismo só sem pausas anti-ban e sem archive customizado (ambos pressupõem ordem serial)"""
+    return (
+        settings.workers > 1
+        and n_entries > 1
+        and not settings.archive_id
+        and settings.delay_between_downloads <= 0
+        and not (settings.batch_size and settings.batch_delay > 0)
+    )
+
+
+async def _download_parallel(
+    urls: list[str],
+    settings: Settings,
+    on_progress: Optional[Callable],
+) -> dict:
+    """Baixa as entradas com até `settings.workers` instâncias do yt-dlp em paralelo"""
+    results: list[Optional[dict]] = [None] * len(urls)
+    fatal: list[dict] = []
+    pending = iter(enumerate(urls))
+
+    async def worker() -> None:
+        progress_callback = DownloadProgress(on_progress)
+        progress_callback.total_files = len(urls)
+        opts = _base_opts(settings)
+        opts["progress_hooks"] = [progress_callback]
+
+        # YoutubeDL não é thread-safe: uma instância por worker
+        ydl = await asyncio.to_thread(YoutubeDL, opts)
+        with ydl:
+            for idx, video_url in pending:
+                if fatal:
+                    return
+                progress_callback.current_index = idx + 1
+                entry_result, entry_fatal = await asyncio.to_thread(_download_entry, ydl, video_url, settings)
+                if entry_fatal:
+                    fatal.append(entry_fatal)
+                    return
+                results[idx] = entry_result
+
+    await asyncio.gather(*(worker() for _ in range(min(settings.workers, len(urls)))))
+
+    if fatal:
+        return fatal[0]
+
+    completed = [r for r in results if r]
+    return {
+        "status": "completed",
+        "results": completed,
+        "total": len(completed),
+    }
+
+
+async def download_video(
     url: str,
     settings: Settings,
     on_progress: Optional[Callable] = None,
@@ -366,6 +511,9 @@ def download_video(
     """
     Baixa um vídeo e retorna informações sobre o download.
 
+    As chamadas ao yt-dlp rodam em threads; as pausas anti-ban usam
+    asyncio.sleep e não prendem nenhuma thread.
+
     Args:
         url: URL do vídeo/playlist
         settings: Configurações de download
@@ -383,104 +531,84 @@ def download_video(
         opts["progress_hooks"] = [progress_callback]
 
         # Extrair informações antes de baixar
-        urls = _extract_entries(url, settings.limit)
+        urls = await asyncio.to_thread(_extract_entries, url, settings.limit)
+        if _can_download_in_parallel(settings, len(urls)):
+            return await _download_parallel(urls, settings, on_progress)
         progress_callback.total_files = len(urls)
 
         results = []
+        archived = (
+            await asyncio.to_thread(_load_custom_archive, settings.archive_file)
+            if settings.archive_id
+            else set()
+        )
 
-        for idx, video_url in enumerate(urls):
-            progress_callback.current_index = idx + 1
-
-            # Verificar se já foi baixado
-            if settings.archive_id and _custom_archive_has(settings.archive_file, settings.archive_id):
-                results.append({
-                    "url": video_url,
-                    "status": "skipped",
-                    "message": "Already downloaded (archive)",
-                })
-                continue
-
-            # Baixar
-            with YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
+        # Uma única instância para toda a playlist (evita reinicializar o yt-dlp por vídeo)
+        ydl = await asyncio.to_thread(YoutubeDL, opts)
+        with ydl:
+            for idx, video_url in enumerate(urls):
+                progress_callback.current_index = idx + 1
 
-                if not info:
+                # Verificar se já foi baixado
+                if settings.archive_id and settings.archive_id in archived:
                     results.append({
                         "url": video_url,
-                        "status": "error",
-                        "message": "Falha ao obter metadados do vídeo",
+                        "status": "skipped",
+                        "message": "Already downloaded (archive)",
                     })
                     continue
 
-                conflict = _detect_conflict(ydl, info)
-                if conflict:
-                    rel_path = str(conflict)
-                    try:
-                        rel_path = str(conflict.resolve().relative_to(pathlib.Path(settings.out_dir).resolve()))
-                    except Exception:
-                        rel_path = str(conflict)
-                    return {
-                        "status": "error",
-                        "error": f"Arquivo já existe no destino: {rel_path}",
-                    }
-
-                info = ydl.extract_info(video_url, download=True)
-
-                if info:
-                    output_path = _resolve_existing_media_path(ydl, info) or _resolve_output_path(ydl, info)
-                    results.append({
-                        "url": video_url,
-                        "status": "success",
-                        "title": info.get("title"),
-                        "id": info.get("id"),
-                        "duration": info.get("duration"),
-                        "filepath": output_path,
-                    })
-
-                    # Adicionar ao arquivo de archive
+                # Baixar
+                entry_result, fatal = await asyncio.to_thread(_download_entry, ydl, video_url, settings)
+                if fatal:
+                    return fatal
+                if entry_result:
+                    results.append(entry_result)
+                    if entry_result["status"] == "error":
+                        continue
                     if settings.archive_id:
-                        _custom_archive_add(settings.archive_file, settings.archive_id)
-
-            # === ANTI-BAN: Delays entre downloads ===
-            # Só aplicar delay se não for o último vídeo
-            if idx < len(urls) - 1:
-                # Delay entre vídeos
-                if settings.delay_between_downloads > 0:
-                    delay = settings.delay_between_downloads
-
-                    # Randomizar delay para parecer humano
-                    if settings.randomize_delay:
-                        # Varia entre 80% e 120% do delay configurado
-                        delay = delay * random.uniform(0.8, 1.2)
-
-                    if on_progress:
-                        on_progress({
-                            "status": "waiting",
-                            "message": f"Aguardando {int(delay)}s antes do próximo vídeo...",
-                            "delay_remaining": int(delay),
-                        })
-
-                    time.sleep(delay)
-
-                # Delay entre batches (grupos de vídeos)
-                if settings.batch_size and settings.batch_delay > 0:
-                    # Verificar se completou um batch
-                    videos_downloaded = idx + 1
-                    if videos_downloaded % settings.batch_size == 0:
-                        batch_delay = settings.batch_delay
+                        archived.add(settings.archive_id)
+
+                # === ANTI-BAN: Delays entre downloads ===
+                # Só aplicar delay se não for o último vídeo
+                if idx < len(urls) - 1:
+                    # Delay entre vídeos
+                    if settings.delay_between_downloads > 0:
+                        delay = settings.delay_between_downloads
 
+                        # Randomizar delay para parecer humano
                         if settings.randomize_delay:
-                            batch_delay = batch_delay * random.uniform(0.9, 1.1)
+                            # Varia entre 80% e 120% do delay configurado
+                            delay = delay * random.uniform(0.8, 1.2)
 
                         if on_progress:
                             on_progress({
-                                "status": "batch_waiting",
-                                "message": f"Pausa entre batches: {int(batch_delay)}s...",
-                                "delay_remaining": int(batch_delay),
-                                "batch_completed": videos_downloaded // settings.batch_size,
+                                "status": "waiting",
+                                "message": f"Aguardando {int(delay)}s antes do próximo vídeo...",
+                                "delay_remaining": int(delay),
                             })
 
-                        time.sleep(batch_delay)
+                        await asyncio.sleep(delay)
+
+                    # Delay entre batches (grupos de vídeos)
+                    if settings.batch_size and settings.batch_delay > 0:
+                        # Verificar se completou um batch
+                        videos_downloaded = idx + 1
+                        if videos_downloaded % settings.batch_size == 0:
+                            batch_delay = settings.batch_delay
+
+                            if settings.randomize_delay:
+                                batch_delay = batch_delay * random.uniform(0.9, 1.1)
+
+                            if on_progress:
+                                on_progress({
+                                    "status": "batch_waiting",
+                                    "message": f"Pausa entre batches: {int(batch_delay)}s...",
+                                    "delay_remaining": int(batch_delay),
+                                    "batch_completed": videos_downloaded // settings.batch_size,
+                                })
+
+                            await asyncio.sleep(batch_delay)
 
         return {
             "status": "completed",
@@ -495,16 +623,47 @@ def download_video(
         }
 
 
+def clear_video_info_cache(url: Optional[str] = None) -> None:
+    """Remove uma URL (ou todas) do cache de metadados."""
+    with _video_info_lock:
+        if url is None:
+            _video_info_cache.clear()
+        else:
+            _video_info_cache.pop(url.strip(), None)
+
+
 def get_video_info(url: str) -> dict:
     """
     Obtém informações sobre um vídeo sem baixar.
 
+    Respostas com sucesso ficam em cache por VIDEO_INFO_CACHE_TTL segundos.
+
     Args:
         url: URL do vídeo
 
     Returns:
         Dict com informações do vídeo
     """
+    key = url.strip()
+    now = time.monotonic()
+    with _video_info_lock:
+        cached = _video_info_cache.get(key)
+        if cached and cached[0] > now:
+            _video_info_cache.move_to_end(key)
+            return dict(cached[1])
+
+    result = _fetch_video_info(url)
+    if result.get("status") == "success":
+        with _video_info_lock:
+            _video_info_cache[key] = (now + VIDEO_INFO_CACHE_TTL, result)
+            _video_info_cache.move_to_end(key)
+            while len(_video_info_cache) > VIDEO_INFO_CACHE_MAX:
+                _video_info_cache.popitem(last=False)
+        return dict(result)
+    return result
+
+
+def _fetch_video_info(url: str) -> dict:
     try:
         with YoutubeDL({"quiet": True, "no_warnings": True}) as ydl:
             info = ydl.extract_info(url, download=False)
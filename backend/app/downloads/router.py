@@ -10,7 +10,7 @@ import time
 from fastapi import APIRouter, HTTPException, Request
 
 from .schemas import VideoInfoRequest, VideoInfoResponse, DownloadRequest, DownloadResponse
-from .service import get_video_info, create_download_settings
+from .service import get_video_info
 from app.jobs.service import create_and_start_job
 from app.core.rate_limit import limiter, RateLimits
 from app.core.metrics import DOWNLOAD_REQUESTS, VIDEO_INFO_REQUESTS, VIDEO_INFO_LATENCY
@@ -41,10 +41,10 @@ Obtém metadados de um vídeo ou playlist do YouTube sem baixar.
 async def video_info(request: Request, body: VideoInfoRequest):
     """Obtém informações sobre um vídeo sem baixar."""
     try:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         info = await get_video_info(body.url)
         VIDEO_INFO_REQUESTS.inc()
-        VIDEO_INFO_LATENCY.observe(time.perf_counter() - start)
+        VIDEO_INFO_LATENCY.observe((time.perf_counter_ns() - start) / 1e9)
         return info
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -2,8 +2,9 @@
 Download module schemas (Pydantic models)
 """
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.core.constants import ValidationLimits
 from app.core.validators import (
     validate_url,
     validate_path_safe,
@@ -14,22 +15,70 @@ from app.core.validators import (
 )
 
 
+# OpenAPI examples, shared by the models below
+_VIDEO_URL_EXAMPLE = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+_VIDEO_INFO_REQUEST_SCHEMA_EXTRA = {
+    "example": {
+        "url": _VIDEO_URL_EXAMPLE
+    }
+}
+
+_DOWNLOAD_REQUEST_SCHEMA_EXTRA = {
+    "examples": [
+        {
+            "url": _VIDEO_URL_EXAMPLE,
+            "max_res": 1080,
+            "subs": True,
+            "thumbnails": True
+        },
+        {
+            "url": "https://www.youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf",
+            "max_res": 720,
+            "limit": 10,
+            "delay_between_downloads": 5,
+            "batch_size": 5,
+            "batch_delay": 30
+        }
+    ]
+}
+
+_VIDEO_INFO_RESPONSE_SCHEMA_EXTRA = {
+    "example": {
+        "status": "success",
+        "type": "video",
+        "title": "Never Gonna Give You Up",
+        "uploader": "Rick Astley",
+        "duration": 212,
+        "view_count": 1500000000,
+        "thumbnail": "https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg"
+    }
+}
+
+_DOWNLOAD_RESPONSE_SCHEMA_EXTRA = {
+    "example": {
+        "status": "success",
+        "job_id": "abc123-def456-ghi789",
+        "message": "Download iniciado"
+    }
+}
+
+
 class VideoInfoRequest(BaseModel):
     """Request to get video information without downloading."""
 
     url: str = Field(
         ...,
+        max_length=ValidationLimits.MAX_URL_LENGTH,
         description="URL do vídeo ou playlist do YouTube",
-        json_schema_extra={"example": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"}
+        json_schema_extra={"example": _VIDEO_URL_EXAMPLE}
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-            }
-        }
-    }
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra=_VIDEO_INFO_REQUEST_SCHEMA_EXTRA,
+    )
 
     @field_validator('url')
     @classmethod
@@ -48,8 +97,9 @@ class DownloadRequest(BaseModel):
     # Core settings
     url: str = Field(
         ...,
+        max_length=ValidationLimits.MAX_URL_LENGTH,
         description="URL do vídeo, playlist ou arquivo .txt com URLs",
-        json_schema_extra={"example": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"}
+        json_schema_extra={"example": _VIDEO_URL_EXAMPLE}
     )
     archive_file: str = Field(
         default="./archive.txt",
@@ -97,8 +147,16 @@ class DownloadRequest(BaseModel):
     )
 
     # HTTP Headers
-    referer: Optional[str] = Field(default=None, description="Header Referer para requests")
-    origin: Optional[str] = Field(default=None, description="Header Origin para requests")
+    referer: Optional[str] = Field(
+        default=None,
+        description="Header Referer para requests",
+        max_length=ValidationLimits.MAX_URL_LENGTH
+    )
+    origin: Optional[str] = Field(
+        default=None,
+        description="Header Origin para requests",
+        max_length=ValidationLimits.MAX_URL_LENGTH
+    )
     user_agent: str = Field(default="yt-archiver", description="User Agent string")
 
     # Performance
@@ -108,15 +166,26 @@ class DownloadRequest(BaseModel):
         ge=1,
         le=50
     )
+    workers: int = Field(
+        default=1,
+        description=(
+            "Vídeos da playlist baixados em paralelo "
+            "(ignorado com archive_id, delays ou pausas entre batches)"
+        ),
+        ge=1,
+        le=4
+    )
 
     # File naming
     path: Optional[str] = Field(
         default=None,
-        description="Subpasta personalizada dentro do diretório de saída"
+        description="Subpasta personalizada dentro do diretório de saída",
+        max_length=ValidationLimits.MAX_PATH_LENGTH
     )
     file_name: Optional[str] = Field(
         default=None,
-        description="Nome personalizado para o arquivo (sem extensão)"
+        description="Nome personalizado para o arquivo (sem extensão)",
+        max_length=ValidationLimits.MAX_FILENAME_LENGTH
     )
     archive_id: Optional[str] = Field(
         default=None,
@@ -147,26 +216,11 @@ class DownloadRequest(BaseModel):
         description="Adicionar variação aleatória aos delays"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                    "max_res": 1080,
-                    "subs": True,
-                    "thumbnails": True
-                },
-                {
-                    "url": "https://www.youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf",
-                    "max_res": 720,
-                    "limit": 10,
-                    "delay_between_downloads": 5,
-                    "batch_size": 5,
-                    "batch_delay": 30
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra=_DOWNLOAD_REQUEST_SCHEMA_EXTRA,
+    )
 
     @field_validator('url')
     @classmethod
@@ -226,19 +280,13 @@ class VideoInfoResponse(BaseModel):
     )
     error: Optional[str] = Field(default=None, description="Mensagem de erro, se houver")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "success",
-                "type": "video",
-                "title": "Never Gonna Give You Up",
-                "uploader": "Rick Astley",
-                "duration": 212,
-                "view_count": 1500000000,
-                "thumbnail": "https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg"
-            }
-        }
-    }
+    # Extra keys are dropped, not rejected: playlist info also carries a
+    # "videos" preview list that this model does not expose.
+    model_config = ConfigDict(
+        defer_build=True,
+        frozen=True,
+        json_schema_extra=_VIDEO_INFO_RESPONSE_SCHEMA_EXTRA,
+    )
 
 
 class DownloadResponse(BaseModel):
@@ -253,12 +301,9 @@ class DownloadResponse(BaseModel):
     job_id: str = Field(description="ID único do job para acompanhamento")
     message: str = Field(description="Mensagem de confirmação")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "success",
-                "job_id": "abc123-def456-ghi789",
-                "message": "Download iniciado"
-            }
-        }
-    }
+    model_config = ConfigDict(
+        defer_build=True,
+        extra="forbid",
+        frozen=True,
+        json_schema_extra=_DOWNLOAD_RESPONSE_SCHEMA_EXTRA,
+    )
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import List, Optional, Set
 
 from app.config import settings
-from app.core.blocking import run_blocking, get_drive_semaphore
+from app.core.blocking import run_drive_blocking
 from app.core.logging import get_module_logger
 from .database import get_database
 from .repository import get_repository
@@ -75,9 +75,8 @@ async def full_sync() -> SyncResult:
 
         # Get videos from Drive API
         logger.debug("Fetching videos from Drive API...")
-        drive_videos = await run_blocking(
+        drive_videos = await run_drive_blocking(
             drive_manager.list_videos,
-            semaphore=get_drive_semaphore(),
             label="drive_cache.full_sync.list_videos",
         )
 
@@ -188,9 +187,8 @@ async def incremental_sync() -> SyncResult:
         logger.debug(f"Starting incremental sync since {last_sync}")
 
         # Get current videos from Drive
-        drive_videos = await run_blocking(
+        drive_videos = await run_drive_blocking(
             drive_manager.list_videos,
-            semaphore=get_drive_semaphore(),
             label="drive_cache.incremental.list_videos",
         )
 
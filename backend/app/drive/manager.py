@@ -196,7 +196,7 @@ class DriveManager:
         if isinstance(exc, HttpError):
             status = getattr(exc, "resp", None)
             status_code = status.status if status else None
-            return bool(status_code in set(settings.DRIVE_UPLOAD_RETRY_STATUSES))
+            return status_code in settings.DRIVE_UPLOAD_RETRY_STATUSES
         if isinstance(
             exc,
             (
@@ -12,7 +12,7 @@ from typing import Dict, List, Optional, Generator, Any
 
 from .manager import drive_manager
 from app.config import settings
-from app.core.blocking import run_blocking, get_drive_semaphore, get_catalog_semaphore
+from app.core.blocking import run_drive_blocking, run_catalog_blocking
 from app.core.security import validate_path_within_base, validate_file_exists, sanitize_path
 from app.core.logging import get_module_logger
 from app.core.http import request_with_retry
@@ -92,10 +92,9 @@ async def _run_drive_cleanup_job(job_id: str, folder_ids: List[str]) -> None:
             job["progress"]["status"] = "running"
             store.set_job(job_id, job)
 
-        result = await run_blocking(
+        result = await run_drive_blocking(
             drive_manager.cleanup_empty_folders,
             folder_ids,
-            semaphore=get_drive_semaphore(),
             label="drive.cleanup_folders",
         )
 
@@ -216,9 +215,8 @@ async def list_videos_paginated(page: int = 1, limit: int = 24) -> Dict:
 
     # Fallback to direct Drive API
     logger.debug("Fetching videos from Drive API")
-    videos = await run_blocking(
+    videos = await run_drive_blocking(
         drive_manager.list_videos,
-        semaphore=get_drive_semaphore(),
         label="drive.list_videos",
     )
     total = len(videos)
@@ -375,15 +373,13 @@ async def _run_single_upload_job(job_id: str, full_path: str, video_path: str) -
 async def get_sync_status(base_dir: str = "./downloads") -> Dict:
     """Get sync status between local and Drive (catalog-first)."""
     if settings.CATALOG_ENABLED:
-        return await run_blocking(
+        return await run_catalog_blocking(
             get_sync_status_from_catalog,
-            semaphore=get_catalog_semaphore(),
             label="drive.sync_status.catalog",
         )
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.get_sync_state,
         base_dir,
-        semaphore=get_drive_semaphore(),
         label="drive.sync_status",
     )
     local_only = result.get("local_only") or []
@@ -591,9 +587,8 @@ async def get_sync_items_from_catalog(*, kind: str, page: int, limit: int) -> Di
 
         return {"kind": kind, "total": total, "page": page, "limit": limit, "items": page_items}
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="drive.sync_items",
     )
 
@@ -608,9 +603,8 @@ async def resolve_drive_file_id_by_path(*, drive_path: str) -> str:
             raise VideoNotFoundException("Vídeo não encontrado no catálogo do Drive", path=drive_path)
         return file_id
 
-    return await run_blocking(
+    return await run_catalog_blocking(
         _run,
-        semaphore=get_catalog_semaphore(),
         label="drive.resolve_path",
     )
 
@@ -669,15 +663,13 @@ async def _run_batch_upload_job(job_id: str, base_dir: str) -> None:
         # Obter lista de arquivos para upload
         if settings.CATALOG_ENABLED:
             repo = CatalogRepository()
-            counts = await run_blocking(
+            counts = await run_catalog_blocking(
                 repo.get_counts,
-                semaphore=get_catalog_semaphore(),
                 label="drive.sync.counts",
             )
-            drive_state = await run_blocking(
+            drive_state = await run_catalog_blocking(
                 repo.get_state,
                 "drive",
-                semaphore=get_catalog_semaphore(),
                 label="drive.sync.state",
             )
             drive_imported = bool(drive_state.get("last_imported_at"))
@@ -686,19 +678,17 @@ async def _run_batch_upload_job(job_id: str, base_dir: str) -> None:
             if counts.get("drive", 0) == 0 and not drive_imported:
                 raise Exception("Catálogo do Drive vazio: rode /api/catalog/drive/import ou /api/catalog/drive/rebuild antes de sincronizar.")
 
-            sync_data = await run_blocking(
+            sync_data = await run_catalog_blocking(
                 _get_catalog_sets,
                 repo,
-                semaphore=get_catalog_semaphore(),
                 label="drive.sync.sets",
             )
             local_only, _, _ = _compute_sync_sets(sync_data)
             local_only = sorted(local_only)
         else:
-            sync_state = await run_blocking(
+            sync_state = await run_drive_blocking(
                 drive_manager.get_sync_state,
                 base_dir,
-                semaphore=get_drive_semaphore(),
                 label="drive.sync_state",
             )
             local_only = sync_state["local_only"]
@@ -872,17 +862,15 @@ async def delete_video(file_id: str) -> Dict:
             assets = repo.get_drive_assets_by_file_id(file_id)
             return [str(a["drive_file_id"]) for a in assets if a.get("drive_file_id")]
 
-        related_ids = await run_blocking(
+        related_ids = await run_catalog_blocking(
             _get_related_ids,
-            semaphore=get_catalog_semaphore(),
             label="drive.delete.related_ids",
         )
 
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.delete_video_with_related,
         file_id,
         related_ids,
-        semaphore=get_drive_semaphore(),
         label="drive.delete_video",
     )
 
@@ -942,17 +930,15 @@ async def delete_videos_batch(file_ids: List[str]) -> Dict:
                 mapping[vid] = [str(a["drive_file_id"]) for a in assets if a.get("drive_file_id")]
             return mapping
 
-        related_map = await run_blocking(
+        related_map = await run_catalog_blocking(
             _get_related_map,
-            semaphore=get_catalog_semaphore(),
             label="drive.delete_batch.related_map",
         )
 
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.delete_videos_with_related,
         file_ids,
         related_map,
-        semaphore=get_drive_semaphore(),
         label="drive.delete_batch",
     )
 
@@ -992,10 +978,9 @@ async def delete_videos_batch(file_ids: List[str]) -> Dict:
 
 async def get_drive_share_status(file_id: str) -> Dict:
     """Get current public sharing status for a Drive file."""
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.get_share_status,
         file_id,
-        semaphore=get_drive_semaphore(),
         label="drive.share.status",
     )
 
@@ -1008,10 +993,9 @@ async def get_drive_share_status(file_id: str) -> Dict:
 
 async def share_drive_video(file_id: str) -> Dict:
     """Enable public sharing for a Drive video."""
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.enable_share,
         file_id,
-        semaphore=get_drive_semaphore(),
         label="drive.share.enable",
     )
 
@@ -1037,10 +1021,9 @@ async def share_drive_video(file_id: str) -> Dict:
 
 async def unshare_drive_video(file_id: str) -> Dict:
     """Disable public sharing for a Drive video."""
-    await run_blocking(
+    await run_drive_blocking(
         drive_manager.disable_share,
         file_id,
-        semaphore=get_drive_semaphore(),
         label="drive.share.disable",
     )
 
@@ -1159,11 +1142,10 @@ async def rename_drive_video(file_id: str, new_name: str) -> Dict:
     """
     Rename a video in Drive and write-through the catalog + snapshot publish.
     """
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.rename_file,
         file_id,
         new_name,
-        semaphore=get_drive_semaphore(),
         label="drive.rename",
     )
     if settings.CATALOG_ENABLED and result.get("status") == "success":
@@ -1184,12 +1166,11 @@ async def update_drive_thumbnail(file_id: str, thumbnail_data: bytes, file_ext:
     """
     Update a Drive thumbnail and write-through the catalog + snapshot publish.
     """
-    result = await run_blocking(
+    result = await run_drive_blocking(
         drive_manager.update_thumbnail,
         file_id,
         thumbnail_data,
         file_ext,
-        semaphore=get_drive_semaphore(),
         label="drive.update_thumbnail",
     )
     if settings.CATALOG_ENABLED and result.get("status") == "success":
@@ -1326,14 +1307,14 @@ async def _run_external_upload_job(
             file_id = uploaded_file.get("file_id")
             if not file_name or not file_id:
                 continue
-            if any(str(file_name).lower().endswith(ext) for ext in settings.THUMBNAIL_EXTENSIONS):
+            if Path(str(file_name)).suffix.lower() in settings.THUMBNAIL_EXTENSIONS:
                 thumbnail_by_base[base_key(str(file_name))] = str(file_id)
 
         for uploaded_file in uploaded_files:
             if uploaded_file.get("status") == "success":
                 file_name = uploaded_file.get("name", "")
                 # Only sync video files (not thumbnails, subtitles, etc.)
-                if any(file_name.lower().endswith(ext) for ext in settings.VIDEO_EXTENSIONS):
+                if Path(file_name).suffix.lower() in settings.VIDEO_EXTENSIONS:
                     try:
                         from .cache import sync_video_added
                         video_path = f"{folder_name}/{file_name}"
@@ -1372,10 +1353,7 @@ async def _run_external_upload_job(
                             it
                             for it in items
                             if it.get("name")
-                            and any(
-                                str(it["name"]).lower().endswith(ext)
-                                for ext in settings.VIDEO_EXTENSIONS
-                            )
+                            and Path(str(it["name"])).suffix.lower() in settings.VIDEO_EXTENSIONS
                         ),
                         None,
                     )
@@ -1555,8 +1533,9 @@ async def _run_single_download_job(
                 try:
                     out_dir = Path(base_dir).resolve()
                     video_abs = Path(result.get("path") or "").resolve()
-                    if video_abs.exists() and any(
-                        str(video_abs).lower().endswith(ext) for ext in settings.VIDEO_EXTENSIONS
+                    if (
+                        video_abs.suffix.lower() in settings.VIDEO_EXTENSIONS
+                        and video_abs.exists()
                     ):
                         video_rel = video_abs.relative_to(out_dir).as_posix()
                         thumb_rel = None
@@ -1642,25 +1621,22 @@ async def _run_batch_download_job(job_id: str, base_dir: str) -> None:
         # Obter lista de arquivos para download (apenas no Drive)
         if settings.CATALOG_ENABLED:
             repo = CatalogRepository()
-            counts = await run_blocking(
+            counts = await run_catalog_blocking(
                 repo.get_counts,
-                semaphore=get_catalog_semaphore(),
                 label="drive.download.counts",
             )
-            drive_state = await run_blocking(
+            drive_state = await run_catalog_blocking(
                 repo.get_state,
                 "drive",
-                semaphore=get_catalog_semaphore(),
                 label="drive.download.state",
             )
             drive_imported = bool(drive_state.get("last_imported_at"))
             if counts.get("drive", 0) == 0 and not drive_imported:
                 raise Exception("Catálogo do Drive vazio: rode /api/catalog/drive/import ou /api/catalog/drive/rebuild antes de baixar.")
 
-            sync_data = await run_blocking(
+            sync_data = await run_catalog_blocking(
                 _get_catalog_sets,
                 repo,
-                semaphore=get_catalog_semaphore(),
                 label="drive.download.sets",
             )
             _, drive_only_ids, _ = _compute_sync_sets(sync_data)
@@ -1671,18 +1647,16 @@ async def _run_batch_download_job(job_id: str, base_dir: str) -> None:
                 if drive_by_id.get(drive_id)
             ]
         else:
-            sync_state = await run_blocking(
+            sync_state = await run_drive_blocking(
                 drive_manager.get_sync_state,
                 base_dir,
-                semaphore=get_drive_semaphore(),
                 label="drive.download.sync_state",
             )
             drive_only_items = []
             for p in sync_state["drive_only"]:
-                v = await run_blocking(
+                v = await run_drive_blocking(
                     drive_manager.get_video_by_path,
                     p,
-                    semaphore=get_drive_semaphore(),
                     label="drive.download.by_path",
                 )
                 if v:
@@ -10,14 +10,15 @@ import os
 import uuid
 import asyncio
 import re
+import threading
 import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Dict, Any
 from pathlib import Path
 
 from . import store
-from app.downloads.service import create_download_settings, execute_download
-from app.catalog.service import upsert_local_video_from_fs
+from app.downloads.service import execute_download, settings_from_request
+from app.catalog.service import upsert_local_videos_bulk
 from app.config import settings
 from app.core.logging import get_module_logger
 from app.core.exceptions import JobNotFoundException
@@ -37,6 +38,9 @@ logger = get_module_logger("jobs.service")
 
 FORMAT_SUFFIX_RE = re.compile(r"^\.f\d+$", re.IGNORECASE)
 TEMP_SUFFIXES = {".part", ".ytdl", ".temp"}
+# Matches the SSE polling cadence in the jobs router; flushing more often
+# would only produce store writes that no client ever observes.
+PROGRESS_FLUSH_INTERVAL = 0.5
 
 
 def get_job_or_raise(job_id: str) -> Dict[str, Any]:
@@ -90,19 +94,28 @@ def _resolve_video_path(candidate: Path) -> Optional[Path]:
     return None
 
 
+def _find_thumbnail_rel(video: Path, out_dir: Path) -> Optional[str]:
+    for ext in settings.THUMBNAIL_EXTENSIONS:
+        candidate = video.with_suffix(ext)
+        if candidate.exists():
+            return candidate.relative_to(out_dir).as_posix()
+    return None
+
+
 def _scan_recent_videos(base_dir: Path, since_ts: float) -> list[Path]:
     if not base_dir.exists():
         return []
 
+    # Filter on plain strings; only matching videos are wrapped in Path.
     recent: list[Path] = []
     for root, _, files in os.walk(base_dir):
         for name in files:
-            candidate = Path(root) / name
-            if candidate.suffix.lower() not in settings.VIDEO_EXTENSIONS:
+            if os.path.splitext(name)[1].lower() not in settings.VIDEO_EXTENSIONS:
                 continue
+            candidate = os.path.join(root, name)
             try:
-                if candidate.stat().st_mtime >= since_ts:
-                    recent.append(candidate)
+                if os.stat(candidate).st_mtime >= since_ts:
+                    recent.append(Path(candidate))
             except Exception:
                 continue
     return recent
@@ -150,6 +163,54 @@ def update_job_progress(job_id: str, progress: Dict[str, Any]) -> None:
         store.set_job(job_id, job)
 
 
+class ProgressCoalescer:
+    """
+    Buffer progress events and persist only the latest one per flush.
+
+    yt-dlp reports progress from its worker thread; ``push`` only swaps the
+    buffered event, so neither that thread nor the event loop ever waits on a
+    store write. ``run`` is the single writer: it flushes off the loop via
+    ``asyncio.to_thread`` on the SSE polling cadence. The job store only keeps
+    the latest progress, so coalescing drops nothing clients could observe.
+    """
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self._pending: Optional[Dict[str, Any]] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def push(self, progress: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending = progress
+
+    def close(self) -> None:
+        """Drop buffered progress and ignore any later flush."""
+        with self._lock:
+            self._closed = True
+            self._pending = None
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if self._closed:
+                return
+        if pending is not None:
+            update_job_progress(self.job_id, pending)
+
+    async def run(self, stop: asyncio.Event, interval: float = PROGRESS_FLUSH_INTERVAL) -> None:
+        """Flush every ``interval`` seconds until ``stop`` is set, then once more."""
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+                stopped = True
+            except asyncio.TimeoutError:
+                stopped = False
+            await asyncio.to_thread(self.flush)
+            if stopped:
+                return
+
+
 def complete_job(job_id: str, result: Dict[str, Any]) -> None:
     """
     Mark a job as completed.
@@ -215,36 +276,14 @@ async def run_download_job(job_id: str, url: str, request: "DownloadRequest") ->
     try:
 
         # Create settings from request
-        download_settings = create_download_settings(
-            out_dir=settings.DOWNLOADS_DIR,
-            archive_file=request.archive_file,
-            fmt=request.fmt,
-            max_res=request.max_res,
-            subs=request.subs,
-            auto_subs=request.auto_subs,
-            sub_langs=request.sub_langs,
-            thumbnails=request.thumbnails,
-            audio_only=request.audio_only,
-            limit=request.limit,
-            cookies_file=request.cookies_file,
-            referer=request.referer,
-            origin=request.origin,
-            user_agent=request.user_agent,
-            concurrent_fragments=request.concurrent_fragments,
-            custom_path=request.path,
-            file_name=request.file_name,
-            archive_id=request.archive_id,
-            delay_between_downloads=request.delay_between_downloads,
-            batch_size=request.batch_size,
-            batch_delay=request.batch_delay,
-            randomize_delay=request.randomize_delay,
-        )
+        download_settings = settings_from_request(request, settings.DOWNLOADS_DIR)
 
         # Create output directory
         target_dir = os.path.join(settings.DOWNLOADS_DIR, request.path) if request.path else settings.DOWNLOADS_DIR
         os.makedirs(target_dir, exist_ok=True)
 
         finished_files: list[str] = []
+        coalescer = ProgressCoalescer(job_id)
 
         # Progress callback
         def progress_callback(progress: dict):
@@ -252,10 +291,21 @@ async def run_download_job(job_id: str, url: str, request: "DownloadRequest") ->
                 fp = progress.get("filepath")
                 if isinstance(fp, str) and fp:
                     finished_files.append(fp)
-            update_job_progress(job_id, progress)
+            coalescer.push(progress)
 
         # Execute download
-        result = await execute_download(url, download_settings, progress_callback)
+        stop_flushing = asyncio.Event()
+        flusher = asyncio.create_task(coalescer.run(stop_flushing))
+        try:
+            result = await execute_download(url, download_settings, progress_callback)
+        except BaseException:
+            # Cancelled or failed: nothing buffered may land after the final job state
+            coalescer.close()
+            flusher.cancel()
+            raise
+        # Last flush completes before complete_job/fail_job write the final state
+        stop_flushing.set()
+        await flusher
 
         if result["status"] == "error":
             failed = True
@@ -272,6 +322,8 @@ async def run_download_job(job_id: str, url: str, request: "DownloadRequest") ->
             out_dir = Path(settings.DOWNLOADS_DIR).resolve()
             if settings.CATALOG_ENABLED and file_candidates:
                 try:
+                    video_paths: list[str] = []
+                    thumbnail_paths: dict[str, str] = {}
                     for fp in sorted(file_candidates):
                         try:
                             abs_path = Path(fp).resolve()
@@ -285,21 +337,18 @@ async def run_download_job(job_id: str, url: str, request: "DownloadRequest") ->
                             resolved_paths.add(resolved_key)
 
                             rel_path = resolved.relative_to(out_dir).as_posix()
-                            thumb_rel = None
-                            for ext in settings.THUMBNAIL_EXTENSIONS:
-                                candidate = resolved.with_suffix(ext)
-                                if candidate.exists():
-                                    thumb_rel = candidate.relative_to(out_dir).as_posix()
-                                    break
-
-                            await upsert_local_video_from_fs(
-                                video_path=rel_path,
-                                base_dir=str(out_dir),
-                                thumbnail_path=thumb_rel,
-                            )
-                            catalog_updates += 1
+                            video_paths.append(rel_path)
+                            thumb_rel = _find_thumbnail_rel(resolved, out_dir)
+                            if thumb_rel:
+                                thumbnail_paths[rel_path] = thumb_rel
                         except Exception as e:
                             logger.warning(f"Catalog update skipped for {fp}: {e}")
+
+                    catalog_updates += await upsert_local_videos_bulk(
+                        video_paths=video_paths,
+                        base_dir=str(out_dir),
+                        thumbnail_paths=thumbnail_paths,
+                    )
                 except Exception as e:
                     logger.warning(f"Catalog write-through failed (download_complete): {e}")
             if settings.CATALOG_ENABLED and catalog_updates == 0:
@@ -310,6 +359,8 @@ async def run_download_job(job_id: str, url: str, request: "DownloadRequest") ->
                         logger.info(
                             f"Catalog fallback scan found {len(fallback_paths)} new file(s) in {fallback_dir}"
                         )
+                    fallback_rel_paths: list[str] = []
+                    fallback_thumbs: dict[str, str] = {}
                     for resolved in fallback_paths:
                         try:
                             resolved_key = str(resolved)
@@ -318,20 +369,18 @@ async def run_download_job(job_id: str, url: str, request: "DownloadRequest") ->
                             resolved_paths.add(resolved_key)
 
                             rel_path = resolved.relative_to(out_dir).as_posix()
-                            thumb_rel = None
-                            for ext in settings.THUMBNAIL_EXTENSIONS:
-                                candidate = resolved.with_suffix(ext)
-                                if candidate.exists():
-                                    thumb_rel = candidate.relative_to(out_dir).as_posix()
-                                    break
-                            await upsert_local_video_from_fs(
-                                video_path=rel_path,
-                                base_dir=str(out_dir),
-                                thumbnail_path=thumb_rel,
-                            )
-                            catalog_updates += 1
+                            fallback_rel_paths.append(rel_path)
+                            thumb_rel = _find_thumbnail_rel(resolved, out_dir)
+                            if thumb_rel:
+                                fallback_thumbs[rel_path] = thumb_rel
                         except Exception as e:
                             logger.warning(f"Catalog fallback update skipped for {resolved}: {e}")
+
+                    catalog_updates += await upsert_local_videos_bulk(
+                        video_paths=fallback_rel_paths,
+                        base_dir=str(out_dir),
+                        thumbnail_paths=fallback_thumbs,
+                    )
                 except Exception as e:
                     logger.warning(f"Catalog fallback scan failed (download_complete): {e}")
             complete_job(job_id, result)
@@ -26,6 +26,7 @@ from app.drive.router import router as drive_router
 from app.catalog.router import router as catalog_router
 
 # Import background tasks
+from app.catalog.service import flush_pending_drive_publish
 from app.jobs.cleanup import run_cleanup_loop
 from app.drive.cache import (
     run_cache_sync_loop,
@@ -71,6 +72,9 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    # Publish any catalog snapshot still waiting out its debounce window
+    await flush_pending_drive_publish()
+
     if cleanup_task or cache_sync_task:
         logger.info("Shutting down background tasks...")
 
@@ -118,7 +122,7 @@ setup_rate_limiting(app)
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -5,7 +5,7 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
 
 from app.core.logging import get_module_logger
 from app.core.rate_limit import limiter, RateLimits
-from app.core.blocking import run_blocking, get_fs_semaphore
+from app.core.blocking import run_fs_blocking
 from app.config import settings
 from app.catalog.service import upsert_local_video_from_fs
 from .service import save_recording
@@ -28,13 +28,12 @@ async def upload_recording(
     Recebe uma gravação enviada pelo frontend e salva na pasta de downloads.
     """
     try:
-        result = await run_blocking(
+        result = await run_fs_blocking(
             save_recording,
             file=file.file,
             filename=file.filename,
             target_path=target_path,
             base_dir=base_dir,
-            semaphore=get_fs_semaphore(),
             label="recordings.save",
         )
         if settings.CATALOG_ENABLED:
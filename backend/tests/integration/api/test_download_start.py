@@ -0,0 +1,29 @@
+"""
+Integration tests for the download start endpoint.
+"""
+import pytest
+import httpx
+
+from app.downloads import router as downloads_router
+
+
+@pytest.mark.asyncio
+async def test_start_download_returns_job_fields(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def fake_create_and_start_job(_request) -> str:
+        return "job-start-1"
+
+    monkeypatch.setattr(downloads_router, "create_and_start_job", fake_create_and_start_job)
+
+    response = await client.post(
+        "/api/download",
+        json={"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "success",
+        "job_id": "job-start-1",
+        "message": "Download iniciado",
+    }
@@ -64,3 +64,28 @@ async def test_bootstrap_local_and_list_videos_via_catalog(
     assert response4.status_code == 200
     payload2 = response4.json()
     assert payload2["total"] == 0
+
+
+def test_get_videos_bulk_returns_existing_rows_across_chunks():
+    from app.catalog.repository import SQLITE_MAX_PARAMS, CatalogRepository
+
+    repo = CatalogRepository()
+    uids = [f"local:Channel/video_{i}.mp4" for i in range(SQLITE_MAX_PARAMS + 5)]
+    for uid in (uids[0], uids[-1]):
+        repo.upsert_video(
+            video_uid=uid,
+            location="local",
+            source="custom",
+            title="video",
+            channel="Channel",
+            duration_seconds=None,
+            created_at=None,
+            modified_at=None,
+            status="available",
+        )
+
+    rows = repo.get_videos_bulk(uids)
+
+    assert set(rows) == {uids[0], uids[-1]}
+    assert rows[uids[-1]]["location"] == "local"
+    assert repo.get_videos_bulk([]) == {}
@@ -4,10 +4,12 @@ Download completion catalog write-through tests (no yt-dlp invocation).
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
 
+from app.catalog import service as catalog_service
 from app.catalog.repository import CatalogRepository
 from app.config import settings
 from app.downloads.schemas import DownloadRequest
@@ -48,3 +50,31 @@ async def test_download_completion_upserts_local_catalog(tmp_path: Path, monkeyp
     assert repo.get_counts()["local"] == 1
     row = repo.get_video("local:Channel/video.mp4")
     assert row
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_skips_failing_video_and_keeps_the_rest(tmp_path: Path, monkeypatch):
+    repo = CatalogRepository()
+    repo.clear_location("local")
+    monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
+
+    for name in ("a.mp4", "b.mp4"):
+        (tmp_path / name).write_bytes(b"fake video")
+
+    original = catalog_service._write_local_video_row
+
+    def flaky_write(repo_, *, video_path, **kwargs):
+        if video_path == "a.mp4":
+            raise sqlite3.OperationalError("database is locked")
+        return original(repo_, video_path=video_path, **kwargs)
+
+    monkeypatch.setattr(catalog_service, "_write_local_video_row", flaky_write)
+
+    written = await catalog_service.upsert_local_videos_bulk(
+        video_paths=["a.mp4", "b.mp4"],
+        base_dir=str(tmp_path),
+        repo=repo,
+    )
+
+    assert written == 1
+    assert repo.get_video("local:b.mp4")
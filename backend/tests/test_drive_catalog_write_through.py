@@ -41,6 +41,7 @@ async def test_drive_rename_updates_catalog_and_publishes(client: httpx.AsyncCli
     repo = CatalogRepository()
     monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
     monkeypatch.setattr(settings, "CATALOG_DRIVE_AUTO_PUBLISH", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_PUBLISH_DEBOUNCE_S", 0)
     monkeypatch.setattr(drive_manager, "is_authenticated", lambda: True)
 
     _seed_drive_video(repo, file_id="vid123", drive_path="Channel/old.mp4")
@@ -77,6 +78,7 @@ async def test_drive_thumbnail_update_updates_catalog_and_publishes(client: http
     repo = CatalogRepository()
     monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
     monkeypatch.setattr(settings, "CATALOG_DRIVE_AUTO_PUBLISH", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_PUBLISH_DEBOUNCE_S", 0)
     monkeypatch.setattr(drive_manager, "is_authenticated", lambda: True)
 
     _seed_drive_video(repo, file_id="vid123", drive_path="Channel/old.mp4")
@@ -107,6 +109,10 @@ async def test_drive_thumbnail_update_updates_catalog_and_publishes(client: http
     assets = repo.get_assets(video_uid="drive:vid123", location="drive")
     thumb = next((a for a in assets if a.get("kind") == "thumbnail"), None)
     assert thumb and thumb.get("drive_file_id") == "thumb2"
+    row = repo.get_video("drive:vid123")
+    assert "Channel/old.mp4" in (row.get("extra_json") or "")
+    assert row.get("status") == "available"
+    assert row.get("modified_at") != "2025-01-01T00:00:00"
     assert published["called"] == 1
 
 
@@ -115,6 +121,7 @@ async def test_drive_delete_removes_catalog_and_publishes(client: httpx.AsyncCli
     repo = CatalogRepository()
     monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
     monkeypatch.setattr(settings, "CATALOG_DRIVE_AUTO_PUBLISH", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_PUBLISH_DEBOUNCE_S", 0)
     monkeypatch.setattr(drive_manager, "is_authenticated", lambda: True)
 
     _seed_drive_video(repo, file_id="vid123", drive_path="Channel/old.mp4")
@@ -73,14 +73,15 @@ def test_drive_api_download_to_path_streams_and_renames(tmp_path: Path, monkeypa
     manager = DriveManager(credentials_path="missing.json", token_path=str(tmp_path / "token.json"))
     monkeypatch.setattr(manager, "_get_access_token", lambda: "token")
 
-    def _fake_requests_get(url: str, headers: Dict[str, str], params: Dict[str, str], stream: bool, timeout: Tuple[int, int]):
+    def _fake_session_request(method: str, url: str, headers: Dict[str, str], params: Dict[str, str], stream: bool, timeout: Tuple[int, int]):
+        assert method == "GET"
         assert url.endswith("/files/file123")
         assert headers.get("Authorization") == "Bearer token"
         assert params.get("alt") == "media"
         assert stream is True
         return _FakeStreamingResponse(status_code=200, chunks=[b"abc", b"def"])
 
-    monkeypatch.setattr("requests.get", _fake_requests_get)
+    monkeypatch.setattr("app.core.http._SESSION.request", _fake_session_request)
 
     dest = tmp_path / "out.mp4"
     written = manager._drive_api_download_to_path(file_id="file123", dest_path=dest, expected_size=6)
@@ -93,11 +94,11 @@ def test_drive_api_download_to_path_incomplete_removes_part(tmp_path: Path, monk
     manager = DriveManager(credentials_path="missing.json", token_path=str(tmp_path / "token.json"))
     monkeypatch.setattr(manager, "_get_access_token", lambda: "token")
 
-    def _fake_requests_get(url: str, headers: Dict[str, str], params: Dict[str, str], stream: bool, timeout: Tuple[int, int]):
-        _ = (url, headers, params, stream, timeout)
+    def _fake_session_request(method: str, url: str, headers: Dict[str, str], params: Dict[str, str], stream: bool, timeout: Tuple[int, int]):
+        _ = (method, url, headers, params, stream, timeout)
         return _FakeStreamingResponse(status_code=200, chunks=[b"abc"])
 
-    monkeypatch.setattr("requests.get", _fake_requests_get)
+    monkeypatch.setattr("app.core.http._SESSION.request", _fake_session_request)
 
     dest = tmp_path / "out.mp4"
     with pytest.raises(Exception, match="Incomplete download"):
@@ -74,6 +74,10 @@ class TestValidatePathSafe:
         with pytest.raises(ValueError):
             validate_path_safe("..\\..\\windows\\system32")
 
+    def test_dots_inside_name_allowed(self):
+        """Test '..' inside a path component is not treated as traversal."""
+        assert validate_path_safe("channel/foo..bar/video.mp4") == "channel/foo..bar/video.mp4"
+
 
 class TestSanitizeFilename:
     """Tests for filename sanitization."""
@@ -109,6 +113,11 @@ class TestSanitizeFilename:
         assert "í" in result
         assert "测试" in result
 
+    def test_collapses_repeated_replacements(self):
+        """Test runs of unsafe characters collapse to one replacement."""
+        assert sanitize_filename("a<<>>::b") == "a_b"
+        assert sanitize_filename("a" + "?" * 10000 + "b", replacement="-") == "a-b"
+
     def test_trims_whitespace(self):
         """Test whitespace is trimmed."""
         filename = "  video title  .mp4  "
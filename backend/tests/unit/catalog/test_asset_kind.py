@@ -0,0 +1,29 @@
+"""
+Unit tests for Drive asset kind detection.
+"""
+import pytest
+
+from app.catalog.service import _asset_kind_for_name
+
+
+@pytest.mark.parametrize(
+    ("name", "kind"),
+    [
+        ("Channel/Video.MP4", "video"),
+        ("video.webm", "video"),
+        ("video.JPEG", "thumbnail"),
+        ("video.info.json", "info_json"),
+        ("video.INFO.JSON", "info_json"),
+        ("video.description", "other"),
+        ("video.en.vtt", "subtitles"),
+        ("video.srt", "subtitles"),
+        ("video.txt", "transcript"),
+    ],
+)
+def test_asset_kind_for_known_extensions(name: str, kind: str) -> None:
+    assert _asset_kind_for_name(name) == kind
+
+
+@pytest.mark.parametrize("name", ["video", "metadata.json", "info.json", "archive.zip"])
+def test_asset_kind_for_unknown_names(name: str) -> None:
+    assert _asset_kind_for_name(name) is None
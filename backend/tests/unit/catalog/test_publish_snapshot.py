@@ -0,0 +1,208 @@
+"""
+Unit tests for Drive snapshot publishing (fake Drive service).
+"""
+import pytest
+
+from app.catalog import service as catalog_service
+from app.catalog.drive_snapshot import decode_drive_snapshot
+from app.catalog.repository import CatalogRepository
+from app.core.exceptions import DriveNotAuthenticatedException
+
+
+class _Call:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        return self._result
+
+
+class _FakeFiles:
+    def __init__(self, existing):
+        self.existing = existing
+        self.uploaded = []
+
+    def list(self, **kwargs):
+        return _Call({"files": self.existing})
+
+    def create(self, body, media_body, fields):
+        self.uploaded.append(("create", body, media_body.getbytes(0, media_body.size())))
+        return _Call({"id": "snap-new", "name": body["name"], "size": media_body.size()})
+
+    def update(self, fileId, media_body, fields):
+        self.uploaded.append(("update", fileId, media_body.getbytes(0, media_body.size())))
+        return _Call({"id": fileId, "name": "catalog-drive.json.gz", "size": media_body.size()})
+
+
+class _FakeService:
+    def __init__(self, files):
+        self._files = files
+
+    def files(self):
+        return self._files
+
+
+class _FakeDriveManager:
+    def __init__(self, files, authenticated=True):
+        self._service = _FakeService(files)
+        self._authenticated = authenticated
+
+    def is_authenticated(self):
+        return self._authenticated
+
+    def get_service(self):
+        return self._service
+
+    def get_or_create_root_folder(self):
+        return "root"
+
+    def ensure_folder(self, name, parent_id):
+        return "catalog-folder"
+
+
+def _seed_drive_video(repo: CatalogRepository) -> None:
+    repo.upsert_video(
+        video_uid="drive:vid1",
+        location="drive",
+        source="custom",
+        title="Video",
+        channel="Channel",
+        duration_seconds=None,
+        created_at=None,
+        modified_at=None,
+        status="available",
+        extra={"drive_path": "Channel/Video.mp4"},
+    )
+    repo.replace_assets(
+        video_uid="drive:vid1",
+        location="drive",
+        assets=[{"kind": "video", "drive_file_id": "vid1"}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_creates_snapshot_when_missing(monkeypatch):
+    repo = CatalogRepository()
+    _seed_drive_video(repo)
+    files = _FakeFiles(existing=[])
+    monkeypatch.setattr("app.drive.manager.drive_manager", _FakeDriveManager(files))
+
+    result = await catalog_service.publish_drive_snapshot(repo=repo)
+
+    assert result["status"] == "success"
+    assert result["file_id"] == "snap-new"
+    assert result["videos"] == 1
+    action, body, blob = files.uploaded[0]
+    assert action == "create"
+    assert body["parents"] == ["catalog-folder"]
+    assert decode_drive_snapshot(blob)["videos"][0]["video_uid"] == "drive:vid1"
+
+
+@pytest.mark.asyncio
+async def test_publish_updates_existing_snapshot_when_forced(monkeypatch):
+    repo = CatalogRepository()
+    files = _FakeFiles(existing=[{"id": "snap-1", "name": "catalog-drive.json.gz"}])
+    monkeypatch.setattr("app.drive.manager.drive_manager", _FakeDriveManager(files))
+
+    result = await catalog_service.publish_drive_snapshot(repo=repo, force=True)
+
+    assert result["file_id"] == "snap-1"
+    assert files.uploaded[0][0] == "update"
+
+
+@pytest.mark.asyncio
+async def test_publish_raises_original_error_when_not_authenticated(monkeypatch):
+    files = _FakeFiles(existing=[])
+    monkeypatch.setattr(
+        "app.drive.manager.drive_manager", _FakeDriveManager(files, authenticated=False)
+    )
+
+    repo = CatalogRepository()
+
+    def fail_export():
+        raise AssertionError("snapshot should not be exported without auth")
+
+    monkeypatch.setattr(repo, "export_drive_snapshot_items", fail_export)
+
+    with pytest.raises(DriveNotAuthenticatedException):
+        await catalog_service.publish_drive_snapshot(repo=repo)
+    assert files.uploaded == []
+
+
+@pytest.mark.asyncio
+async def test_auto_publish_coalesces_burst_of_mutations(monkeypatch):
+    import asyncio
+
+    from app.config import settings
+
+    calls = {"count": 0}
+
+    async def fake_publish(*args, **kwargs):
+        calls["count"] += 1
+        return {"status": "success"}
+
+    monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_AUTO_PUBLISH", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_PUBLISH_DEBOUNCE_S", 0.05)
+    monkeypatch.setattr(catalog_service, "publish_drive_snapshot", fake_publish)
+
+    for reason in ("drive_rename", "drive_update_thumbnail", "drive_delete"):
+        assert await catalog_service.maybe_publish_drive_snapshot(reason=reason) is None
+    assert calls["count"] == 0
+
+    await asyncio.wait_for(catalog_service._publish_task, timeout=1)
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_auto_publish_uses_latest_caller_repo(monkeypatch):
+    import asyncio
+
+    from app.config import settings
+
+    seen = []
+
+    async def fake_publish(*args, repo=None, **kwargs):
+        seen.append(repo)
+        return {"status": "success"}
+
+    monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_AUTO_PUBLISH", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_PUBLISH_DEBOUNCE_S", 0.05)
+    monkeypatch.setattr(catalog_service, "publish_drive_snapshot", fake_publish)
+
+    first, last = CatalogRepository(), CatalogRepository()
+    await catalog_service.maybe_publish_drive_snapshot(reason="drive_rename", repo=first)
+    await catalog_service.maybe_publish_drive_snapshot(reason="drive_delete", repo=last)
+    task = catalog_service._publish_task
+    assert task in catalog_service._publish_tasks
+
+    await asyncio.wait_for(task, timeout=1)
+    assert seen == [last]
+    assert catalog_service._publish_reason == "drive_delete"
+    assert task not in catalog_service._publish_tasks
+
+
+@pytest.mark.asyncio
+async def test_flush_runs_publish_pending_in_debounce_window(monkeypatch):
+    from app.config import settings
+
+    calls = {"count": 0}
+
+    async def fake_publish(*args, **kwargs):
+        calls["count"] += 1
+        return {"status": "success"}
+
+    monkeypatch.setattr(settings, "CATALOG_ENABLED", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_AUTO_PUBLISH", True)
+    monkeypatch.setattr(settings, "CATALOG_DRIVE_PUBLISH_DEBOUNCE_S", 60)
+    monkeypatch.setattr(catalog_service, "publish_drive_snapshot", fake_publish)
+
+    await catalog_service.maybe_publish_drive_snapshot(reason="drive_delete")
+    pending = catalog_service._publish_task
+
+    await catalog_service.flush_pending_drive_publish()
+
+    assert calls["count"] == 1
+    assert pending.cancelled()
+    assert catalog_service._publish_task is None
@@ -0,0 +1,54 @@
+"""
+Unit tests for blocking IO helpers.
+"""
+import threading
+
+from app.core.blocking import run_catalog_blocking, run_drive_blocking, run_fs_blocking
+from app.core.request_context import get_request_id, reset_request_id, set_request_id
+
+
+def _thread_and_request_id() -> tuple[str, str | None]:
+    return threading.current_thread().name, get_request_id()
+
+
+async def test_blocking_calls_run_on_dedicated_pools_with_caller_context() -> None:
+    token = set_request_id("req-blocking")
+    try:
+        drive = await run_drive_blocking(_thread_and_request_id)
+        fs = await run_fs_blocking(_thread_and_request_id)
+        catalog = await run_catalog_blocking(_thread_and_request_id)
+    finally:
+        reset_request_id(token)
+
+    assert drive[0].startswith("blocking-drive")
+    assert fs[0].startswith("blocking-fs")
+    assert catalog[0].startswith("blocking-catalog")
+    assert {drive[1], fs[1], catalog[1]} == {"req-blocking"}
+
+
+async def test_blocking_call_forwards_args_and_kwargs() -> None:
+    assert await run_catalog_blocking(divmod, 7, 2) == (3, 1)
+    assert await run_fs_blocking(int, "ff", base=16) == 255
+
+
+async def test_blocking_label_logs_only_when_debug_enabled() -> None:
+    import logging
+
+    from app.core import blocking
+
+    records: list[str] = []
+    handler = logging.Handler()
+    handler.emit = lambda record: records.append(record.getMessage())  # type: ignore[method-assign]
+    previous_level = blocking.logger.level
+    blocking.logger.addHandler(handler)
+    try:
+        blocking.logger.setLevel(logging.INFO)
+        await run_fs_blocking(int, "1", label="quiet")
+        assert records == []
+
+        blocking.logger.setLevel(logging.DEBUG)
+        await run_fs_blocking(int, "1", label="loud")
+        assert records == ["Blocking start: loud", "Blocking end: loud"]
+    finally:
+        blocking.logger.removeHandler(handler)
+        blocking.logger.setLevel(previous_level)
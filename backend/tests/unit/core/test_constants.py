@@ -0,0 +1,34 @@
+"""
+Unit tests for shared constants.
+"""
+import pytest
+
+from app.core.constants import MimeTypes
+
+
+@pytest.mark.parametrize(
+    "extension, expected",
+    [
+        (".mp4", "video/mp4"),
+        (".MKV", "video/x-matroska"),
+        (".m4a", "audio/mp4"),
+        (".Jpeg", "image/jpeg"),
+        (".bmp", "image/bmp"),
+        (".xyz", "application/octet-stream"),
+    ],
+)
+def test_mime_types_get(extension: str, expected: str) -> None:
+    assert MimeTypes.get(extension) == expected
+
+
+def test_mime_types_get_custom_default() -> None:
+    assert MimeTypes.get(".nope", "text/plain") == "text/plain"
+
+
+def test_job_status_active_and_finished() -> None:
+    from app.core.constants import JobStatus
+
+    assert JobStatus.is_active("pending") and JobStatus.is_active("downloading")
+    assert not JobStatus.is_active("completed")
+    assert all(JobStatus.is_finished(s) for s in ("completed", "error", "cancelled"))
+    assert not JobStatus.is_finished("downloading")
@@ -13,6 +13,7 @@ from app.core.errors import (
     create_error_response,
     raise_error,
     http_exception_handler,
+    validation_exception_handler,
 )
 
 
@@ -41,6 +42,45 @@ def test_create_error_response_sets_request_id_header() -> None:
     assert response.headers.get("X-Request-Id") == "req-1"
 
 
+def test_create_error_response_payload_shape() -> None:
+    response = create_error_response(
+        status_code=404,
+        error_code=ErrorCode.VIDEO_NOT_FOUND,
+        message="Vídeo não encontrado",
+        details={"path": "a/b.mp4"},
+    )
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == {
+        "error_code": ErrorCode.VIDEO_NOT_FOUND,
+        "message": "Vídeo não encontrado",
+        "details": {"path": "a/b.mp4"},
+        "request_id": None,
+    }
+    assert "X-Request-Id" not in response.headers
+
+
+@pytest.mark.parametrize("request_id", [None, "req-9"])
+def test_static_error_body_matches_dynamic_encoding(request_id) -> None:
+    from app.core.exceptions import DriveNotAuthenticatedException
+
+    exc = DriveNotAuthenticatedException()
+    static = create_error_response(
+        exc.status_code, exc.error_code, exc.message, request_id=request_id
+    )
+    dynamic = create_error_response(
+        exc.status_code, exc.error_code, "Custom message", request_id=request_id
+    )
+    assert json.loads(static.body) == {
+        "error_code": ErrorCode.DRIVE_NOT_AUTHENTICATED,
+        "message": exc.message,
+        "details": None,
+        "request_id": request_id,
+    }
+    assert json.loads(dynamic.body)["message"] == "Custom message"
+    assert static.headers["content-type"] == "application/json"
+
+
 def test_raise_error_raises_app_exception() -> None:
     with pytest.raises(AppException) as exc:
         raise_error(
@@ -59,3 +99,31 @@ async def test_http_exception_handler_maps_code() -> None:
     response = await http_exception_handler(request, exc)
     payload = json.loads(response.body.decode("utf-8"))
     assert payload["error_code"] == ErrorCode.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_validation_exception_handler_flattens_errors() -> None:
+    from fastapi.exceptions import RequestValidationError
+
+    exc = RequestValidationError(
+        [{"loc": ("body", "url"), "msg": "Field required", "type": "missing"}]
+    )
+    response = await validation_exception_handler(_make_request(), exc)
+    payload = json.loads(response.body.decode("utf-8"))
+    assert response.status_code == 422
+    assert payload["error_code"] == ErrorCode.VALIDATION_ERROR
+    assert payload["details"] == {
+        "errors": [{"field": "body.url", "message": "Field required", "type": "missing"}]
+    }
+
+
+def test_static_error_defaults_match_exception_defaults() -> None:
+    from app.core.exceptions import _STATIC_ERROR_DEFAULTS
+
+    defaults = set()
+    for exc_cls in AppException.__subclasses__():
+        exc = exc_cls()
+        if exc.details is None:
+            defaults.add((exc.error_code, exc.message))
+
+    assert set(_STATIC_ERROR_DEFAULTS) == defaults
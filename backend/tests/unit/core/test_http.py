@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional, Tuple
 import pytest
 import requests
 
+from app.core import http as http_module
 from app.core.http import request_with_retry
 
 
@@ -26,13 +27,13 @@ class _FakeResponse:
 def test_retry_get_on_retryable_status(monkeypatch: pytest.MonkeyPatch) -> None:
     calls = {"count": 0}
 
-    def fake_get(url: str, headers=None, params=None, stream=False, timeout=None):
+    def fake_request(method: str, url: str, headers=None, params=None, stream=False, timeout=None):
         calls["count"] += 1
         if calls["count"] == 1:
             return _FakeResponse(500, text="boom")
         return _FakeResponse(200, json_data={"ok": True})
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_module._SESSION, "request", fake_request)
 
     response = request_with_retry(
         "GET",
@@ -47,11 +48,11 @@ def test_retry_get_on_retryable_status(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_no_retry_when_streaming(monkeypatch: pytest.MonkeyPatch) -> None:
     calls = {"count": 0}
 
-    def fake_get(url: str, headers=None, params=None, stream=False, timeout=None):
+    def fake_request(method: str, url: str, headers=None, params=None, stream=False, timeout=None):
         calls["count"] += 1
         return _FakeResponse(500, text="boom")
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_module._SESSION, "request", fake_request)
 
     response = request_with_retry(
         "GET",
@@ -67,13 +68,13 @@ def test_no_retry_when_streaming(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_retry_on_request_exception(monkeypatch: pytest.MonkeyPatch) -> None:
     calls = {"count": 0}
 
-    def fake_get(url: str, headers=None, params=None, stream=False, timeout=None):
+    def fake_request(method: str, url: str, headers=None, params=None, stream=False, timeout=None):
         calls["count"] += 1
         if calls["count"] == 1:
             raise requests.RequestException("fail")
         return _FakeResponse(200)
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_module._SESSION, "request", fake_request)
 
     response = request_with_retry(
         "GET",
@@ -85,7 +86,7 @@ def test_retry_on_request_exception(monkeypatch: pytest.MonkeyPatch) -> None:
     assert calls["count"] == 2
 
 
-def test_non_get_uses_requests_request(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_non_get_passes_method_to_session(monkeypatch: pytest.MonkeyPatch) -> None:
     calls = {"method": None, "url": None}
 
     def fake_request(method: str, url: str, headers=None, params=None, stream=False, timeout=None):
@@ -93,7 +94,7 @@ def test_non_get_uses_requests_request(monkeypatch: pytest.MonkeyPatch) -> None:
         calls["url"] = url
         return _FakeResponse(200)
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(http_module._SESSION, "request", fake_request)
 
     response = request_with_retry(
         "POST",
@@ -103,3 +104,18 @@ def test_non_get_uses_requests_request(monkeypatch: pytest.MonkeyPatch) -> None:
     assert response.status_code == 200
     assert calls["method"] == "POST"
     assert calls["url"] == "http://example.com"
+
+
+def test_build_cache_response_sets_cache_control() -> None:
+    from app.core.http import build_cache_response
+
+    first = build_cache_response(b"img", "image/jpeg")
+    first.headers["X-Extra"] = "1"
+    second = build_cache_response(b"img2", "image/png", max_age=60)
+    third = build_cache_response(b"img3", "image/jpeg")
+
+    assert first.headers["cache-control"] == "public, max-age=86400"
+    assert second.headers["cache-control"] == "public, max-age=60"
+    assert third.headers["cache-control"] == "public, max-age=86400"
+    assert "x-extra" not in third.headers
+    assert third.body == b"img3"
@@ -0,0 +1,55 @@
+"""
+Unit tests for logging formatters.
+"""
+import json
+import logging
+
+from app.core.logging import _JsonFormatter
+
+
+def _record(msg: str, *args) -> logging.LogRecord:
+    record = logging.LogRecord("yt-archiver.test", logging.WARNING, __file__, 10, msg, args, None)
+    record.request_id = "req-1"
+    return record
+
+
+def test_json_formatter_emits_one_json_object() -> None:
+    line = _JsonFormatter(datefmt="%Y-%m-%d %H:%M:%S").format(_record("Vídeo %s", "não encontrado"))
+    payload = json.loads(line)
+    assert "\n" not in line
+    assert payload["level"] == "WARNING"
+    assert payload["logger"] == "yt-archiver.test"
+    assert payload["message"] == "Vídeo não encontrado"
+    assert payload["request_id"] == "req-1"
+    assert "exc_info" not in payload
+
+
+def test_formatter_time_cache_tracks_the_second() -> None:
+    formatter = _JsonFormatter(datefmt="%H:%M:%S")
+    first = _record("a")
+    first.created = 1_700_000_000.1
+    same_second = _record("b")
+    same_second.created = 1_700_000_000.9
+    next_second = _record("c")
+    next_second.created = 1_700_000_001.0
+
+    assert formatter.formatTime(first, formatter.datefmt) == formatter.formatTime(same_second, formatter.datefmt)
+    assert formatter.formatTime(next_second, formatter.datefmt) != formatter.formatTime(first, formatter.datefmt)
+
+
+def test_pretty_formatter_level_column() -> None:
+    from app.core.logging import _PrettyFormatter
+
+    plain = _PrettyFormatter(datefmt="%H:%M:%S", use_color=False).format(_record("hello"))
+    colored = _PrettyFormatter(datefmt="%H:%M:%S", use_color=True).format(_record("hello"))
+
+    assert " | WARNING  | req:req-1" in plain
+    assert plain.endswith(" | hello")
+    assert "\033[33mWARNING \033[0m" in colored
+
+
+def test_json_formatter_handles_surrogate_escaped_filenames() -> None:
+    line = _JsonFormatter(datefmt="%H:%M:%S").format(_record("Arquivo %s", "bad\udcff.mp4"))
+    payload = json.loads(line)
+    assert payload["message"] == "Arquivo bad\udcff.mp4"
+    assert payload["request_id"] == "req-1"
@@ -0,0 +1,76 @@
+"""
+Unit tests for the Prometheus metrics middleware.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.metrics import get_request_counter, get_request_latency, status_label
+from app.core.middleware.metrics import MetricsMiddleware
+
+
+def _count(method: str, path: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "yt_archiver_http_requests_total",
+        {"method": method, "path": path, "status": status},
+    )
+    return value or 0.0
+
+
+def _build_app(**kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, **kwargs)
+
+    @app.get("/mw-test/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"item_id": item_id}
+
+    @app.get("/mw-test/skip")
+    async def skip():
+        return {}
+
+    return app
+
+
+def test_path_label_uses_route_template() -> None:
+    client = TestClient(_build_app())
+    before = _count("GET", "/mw-test/items/{item_id}", "200")
+
+    client.get("/mw-test/items/a")
+    client.get("/mw-test/items/b")
+
+    assert _count("GET", "/mw-test/items/{item_id}", "200") == before + 2
+    assert _count("GET", "/mw-test/items/a", "200") == 0.0
+
+
+def test_unmatched_and_excluded_paths() -> None:
+    client = TestClient(_build_app(exclude_paths={"/mw-test/skip"}))
+    before_unmatched = _count("GET", "unmatched", "404")
+
+    client.get("/mw-test/nope/123")
+    client.get("/mw-test/skip")
+
+    assert _count("GET", "unmatched", "404") == before_unmatched + 1
+    assert _count("GET", "/mw-test/skip", "200") == 0.0
+
+
+def test_path_allowlist_maps_other_templates() -> None:
+    client = TestClient(_build_app(path_allowlist={"/mw-test/skip"}))
+    before = _count("GET", "other", "200")
+
+    client.get("/mw-test/items/a")
+
+    assert _count("GET", "other", "200") == before + 1
+
+
+def test_request_metric_children_are_reused() -> None:
+    counter = get_request_counter("GET", "/mw-test/cached", 200)
+    latency = get_request_latency("GET", "/mw-test/cached")
+
+    assert get_request_counter("GET", "/mw-test/cached", 200) is counter
+    assert get_request_latency("GET", "/mw-test/cached") is latency
+
+
+def test_status_label_covers_common_and_exotic_codes() -> None:
+    assert status_label(404) == "404"
+    assert status_label(418) == "418"
@@ -2,6 +2,7 @@
 Unit tests for core path utilities.
 """
 from pathlib import Path
+from urllib.parse import quote
 
 import pytest
 
@@ -10,6 +11,7 @@ from app.core.paths import (
     decode_url_path,
     encode_filename_rfc5987,
     ensure_relative_path,
+    clear_path_caches,
     ensure_within_base,
     ensure_file_exists,
 )
@@ -74,3 +76,38 @@ def test_ensure_file_exists_rejects_missing(tmp_path: Path) -> None:
     missing = tmp_path / "missing.txt"
     with pytest.raises(VideoNotFoundException):
         ensure_file_exists(missing)
+
+
+def test_clear_path_caches_picks_up_relinked_base(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "base"
+    link.symlink_to(first)
+    ensure_within_base(first / "file.txt", link)
+
+    link.unlink()
+    link.symlink_to(second)
+    clear_path_caches()
+
+    ensure_within_base(second / "file.txt", link)
+    with pytest.raises(AccessDeniedException):
+        ensure_within_base(first / "file.txt", link)
+
+
+def test_ensure_within_base_rejects_sibling_with_shared_prefix(tmp_path: Path) -> None:
+    base_dir = tmp_path / "base"
+    base_dir.mkdir()
+    sibling = tmp_path / "base-other" / "file.txt"
+    with pytest.raises(AccessDeniedException):
+        ensure_within_base(sibling, base_dir)
+    ensure_within_base(base_dir, base_dir)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["plain-name_1.mp4", "Vídeo ção.mp4", "a/b c?.webm", "日本語 #1.mkv", "100% real.mp4", ""],
+)
+def test_encode_filename_rfc5987_matches_quote(filename: str) -> None:
+    assert encode_filename_rfc5987(filename) == quote(filename)
@@ -51,3 +51,19 @@ def test_rate_limit_exceeded_handler_includes_request_id() -> None:
     assert payload["error_code"] == ErrorCode.RATE_LIMIT_EXCEEDED
     assert payload["request_id"] == "req-123"
     assert response.headers.get("X-Request-Id") == "req-123"
+
+
+def test_rate_limit_exceeded_handler_sets_retry_after() -> None:
+    request = _make_request()
+
+    class _DummyLimit:
+        def __init__(self) -> None:
+            self.error_message = None
+            self.limit = "10 per 1 minute"
+
+    exc = RateLimitExceeded(_DummyLimit())
+    response = rate_limit_exceeded_handler(request, exc)
+
+    payload = json.loads(response.body.decode("utf-8"))
+    assert payload["details"]["retry_after"] == "1 minute"
+    assert response.headers.get("Retry-After") == "1 minute"
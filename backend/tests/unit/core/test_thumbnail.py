@@ -0,0 +1,145 @@
+"""
+Unit tests for thumbnail generation helpers.
+"""
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from app.core import thumbnail as thumbnail_module
+
+
+@pytest.fixture
+def video(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(thumbnail_module, "is_ffmpeg_available", lambda: True)
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"\x00\x00\x00\x20ftypisom")
+    return path
+
+
+def test_generate_thumbnail_skips_probe_by_default(video: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    timestamps: list[float] = []
+
+    def fake_extract(video_path, output_path, timestamp, width, quality, **kwargs):
+        timestamps.append(timestamp)
+        return output_path
+
+    def fail_probe(video_path):
+        raise AssertionError("ffprobe should not run")
+
+    monkeypatch.setattr(thumbnail_module, "_extract_frame", fake_extract)
+    monkeypatch.setattr(thumbnail_module, "get_video_duration", fail_probe)
+
+    assert thumbnail_module.generate_thumbnail(video) == video.with_suffix(".jpg")
+    assert timestamps == [5.0]
+
+
+def test_generate_thumbnail_probes_when_fixed_offset_fails(video: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    timestamps: list[float] = []
+
+    def fake_extract(video_path, output_path, timestamp, width, quality, **kwargs):
+        timestamps.append(timestamp)
+        return output_path if timestamp < 5.0 else None
+
+    monkeypatch.setattr(thumbnail_module, "_extract_frame", fake_extract)
+    monkeypatch.setattr(thumbnail_module, "get_video_duration", lambda path: 3.0)
+
+    assert thumbnail_module.generate_thumbnail(video) == video.with_suffix(".jpg")
+    assert timestamps == [5.0, 1.0]
+
+
+def test_generate_thumbnail_accurate_probes_first(video: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    timestamps: list[float] = []
+
+    def fake_extract(video_path, output_path, timestamp, width, quality, **kwargs):
+        timestamps.append(timestamp)
+        return output_path
+
+    monkeypatch.setattr(thumbnail_module, "_extract_frame", fake_extract)
+    monkeypatch.setattr(thumbnail_module, "get_video_duration", lambda path: 100.0)
+
+    thumbnail_module.generate_thumbnail(video, accurate=True)
+    assert timestamps == [10.0]
+
+
+def test_find_existing_thumbnail_prefers_extension_order(tmp_path: Path) -> None:
+    video_path = tmp_path / "clip.mp4"
+    video_path.write_bytes(b"data")
+    (tmp_path / "clip.png").write_bytes(b"png")
+    (tmp_path / "clip.jpg").write_bytes(b"jpg")
+    thumbnail_module.clear_thumbnail_cache()
+
+    assert thumbnail_module.find_existing_thumbnail(video_path) == tmp_path / "clip.jpg"
+    assert thumbnail_module.find_existing_thumbnail(tmp_path / "other.mp4") is None
+
+
+def test_find_existing_thumbnail_sees_changes_after_mtime_moves(tmp_path: Path) -> None:
+    video_path = tmp_path / "clip.mp4"
+    video_path.write_bytes(b"data")
+    os.utime(tmp_path, ns=(0, 0))
+    thumbnail_module.clear_thumbnail_cache()
+    assert thumbnail_module.find_existing_thumbnail(video_path) is None
+
+    (tmp_path / "clip.webp").write_bytes(b"webp")
+    os.utime(tmp_path, ns=(10**9, 10**9))
+
+    assert thumbnail_module.find_existing_thumbnail(video_path) == tmp_path / "clip.webp"
+
+
+def test_generate_thumbnail_rejects_truncated_container(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(thumbnail_module, "is_ffmpeg_available", lambda: True)
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run")
+
+    monkeypatch.setattr(thumbnail_module, "_extract_frame", fail_extract)
+    partial = tmp_path / "partial.webm"
+    partial.write_bytes(b"")
+
+    assert thumbnail_module.generate_thumbnail(partial) is None
+
+
+def test_is_playable_container_checks_known_headers(tmp_path: Path) -> None:
+    webm = tmp_path / "a.webm"
+    webm.write_bytes(b"\x1a\x45\xdf\xa3" + b"\x00" * 8)
+    bogus_mp4 = tmp_path / "b.mp4"
+    bogus_mp4.write_bytes(b"<html>not a video</html>")
+    avi = tmp_path / "c.avi"
+    avi.write_bytes(b"RIFF")
+
+    assert thumbnail_module._is_playable_container(webm)
+    assert not thumbnail_module._is_playable_container(bogus_mp4)
+    assert thumbnail_module._is_playable_container(avi)
+
+
+def test_extract_frame_ignores_stale_output(video: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    output = video.with_suffix(".jpg")
+    output.write_bytes(b"\xff" * 200)
+
+    def ffmpeg_writes_nothing(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(thumbnail_module.subprocess, "run", ffmpeg_writes_nothing)
+    assert thumbnail_module._extract_frame(video, output, 5.0, 320, 2) is None
+
+    def ffmpeg_rewrites(cmd, **kwargs):
+        output.unlink()
+        output.write_bytes(b"\xd8" * 300)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(thumbnail_module.subprocess, "run", ffmpeg_rewrites)
+    assert thumbnail_module._extract_frame(video, output, 5.0, 320, 2) == output
+
+
+def test_find_existing_thumbnail_ignores_dirs_and_dangling_links(tmp_path: Path) -> None:
+    thumbnail_module.clear_thumbnail_cache()
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"")
+    (tmp_path / "clip.jpg").mkdir()
+    os.symlink(tmp_path / "missing.png", tmp_path / "clip.png")
+
+    assert thumbnail_module.find_existing_thumbnail(video) is None
+
+    (tmp_path / "clip.webp").write_bytes(b"img")
+    assert thumbnail_module.find_existing_thumbnail(video) == tmp_path / "clip.webp"
@@ -0,0 +1,41 @@
+"""
+Unit tests for upload helpers.
+"""
+import io
+import tempfile
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from app.core.uploads import save_upload_file
+
+
+def test_save_upload_file_copies_in_memory_spool(tmp_path: Path) -> None:
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(b"small payload")
+    spool.seek(0)
+    destination = tmp_path / "small.bin"
+
+    save_upload_file(UploadFile(file=spool, filename="small.bin"), destination)
+
+    assert destination.read_bytes() == b"small payload"
+
+
+def test_save_upload_file_copies_rolled_over_file(tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 4096
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(payload)
+    spool.seek(16)
+    destination = tmp_path / "large.bin"
+
+    save_upload_file(UploadFile(file=spool, filename="large.bin"), destination)
+
+    assert destination.read_bytes() == payload[16:]
+
+
+def test_save_upload_file_copies_plain_stream(tmp_path: Path) -> None:
+    destination = tmp_path / "stream.bin"
+
+    save_upload_file(UploadFile(file=io.BytesIO(b"stream"), filename="stream.bin"), destination)
+
+    assert destination.read_bytes() == b"stream"
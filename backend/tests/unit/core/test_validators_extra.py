@@ -5,6 +5,7 @@ import pytest
 
 from app.core.validators import (
     detect_url_type,
+    validate_url,
     validate_youtube_url,
     validate_resolution,
     validate_delay,
@@ -72,3 +73,45 @@ def test_validate_batch_size_valid() -> None:
 def test_validate_batch_size_invalid() -> None:
     with pytest.raises(ValueError):
         validate_batch_size(0)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "HTTPS://www.youtube.com/watch?v=abc",
+        "https://youtu.be/abc",
+        "https://www.youtube.com",
+    ],
+)
+def test_validate_youtube_url_fast_and_fallback_paths_agree(url: str) -> None:
+    assert validate_youtube_url(f"  {url} ") == url
+
+
+@pytest.mark.parametrize("url", ["https://", "ftp://youtube.com/x", "http://[bad/x"])
+def test_validate_url_rejects_malformed(url: str) -> None:
+    with pytest.raises(URLValidationError):
+        validate_url(url)
+
+
+@pytest.mark.parametrize("url", ["https://wwwyoutube.com/watch?v=abc", "https://w.youtube.com/watch?v=abc"])
+def test_validate_youtube_url_strips_only_www_prefix(url: str) -> None:
+    with pytest.raises(URLValidationError):
+        validate_youtube_url(url)
+
+
+def test_validate_youtube_url_prefix_fast_path_requires_host_boundary() -> None:
+    assert validate_youtube_url(" https://youtu.be/abc ") == "https://youtu.be/abc"
+    with pytest.raises(URLValidationError):
+        validate_youtube_url("https://youtube.com.example.org/watch?v=abc")
+
+
+def test_url_helpers_are_memoized() -> None:
+    url = "https://www.youtube.com/playlist?list=PL-memo"
+    detect_url_type.cache_clear()
+    validate_youtube_url.cache_clear()
+
+    assert detect_url_type(url) == detect_url_type(url) == "playlist"
+    assert validate_youtube_url(url) == validate_youtube_url(url) == url
+
+    assert detect_url_type.cache_info().hits == 1
+    assert validate_youtube_url.cache_info().hits == 1
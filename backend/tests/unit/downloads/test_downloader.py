@@ -0,0 +1,208 @@
+"""
+Unit tests for the yt-dlp downloader helpers.
+"""
+import dataclasses
+import threading
+
+import pytest
+
+from app.downloads import downloader
+
+
+@pytest.fixture(autouse=True)
+def _clear_info_cache():
+    downloader.clear_video_info_cache()
+    yield
+    downloader.clear_video_info_cache()
+
+
+def test_get_video_info_caches_successful_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_fetch(url: str) -> dict:
+        calls.append(url)
+        return {"status": "success", "type": "video", "title": "t"}
+
+    monkeypatch.setattr(downloader, "_fetch_video_info", fake_fetch)
+
+    first = downloader.get_video_info("https://youtu.be/abc")
+    second = downloader.get_video_info(" https://youtu.be/abc ")
+
+    assert first == second
+    assert len(calls) == 1
+
+    downloader.clear_video_info_cache("https://youtu.be/abc")
+    downloader.get_video_info("https://youtu.be/abc")
+    assert len(calls) == 2
+
+
+def test_get_video_info_does_not_cache_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_fetch(url: str) -> dict:
+        calls.append(url)
+        return {"status": "error", "error": "boom"}
+
+    monkeypatch.setattr(downloader, "_fetch_video_info", fake_fetch)
+
+    downloader.get_video_info("https://youtu.be/abc")
+    downloader.get_video_info("https://youtu.be/abc")
+
+    assert len(calls) == 2
+
+
+def test_get_video_info_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        downloader,
+        "_fetch_video_info",
+        lambda url: calls.append(url) or {"status": "success", "title": "t"},
+    )
+    monkeypatch.setattr(downloader, "VIDEO_INFO_CACHE_TTL", -1.0)
+
+    downloader.get_video_info("https://youtu.be/abc")
+    downloader.get_video_info("https://youtu.be/abc")
+
+    assert len(calls) == 2
+
+
+def test_load_custom_archive_reads_custom_keys(tmp_path) -> None:
+    archive = tmp_path / "archive.txt"
+    archive.write_text("youtube abc\ncustom job-1\n  custom job-2  \ncustomjob-3\n", encoding="utf-8")
+
+    assert downloader._load_custom_archive(str(archive)) == {"job-1", "job-2"}
+    assert downloader._load_custom_archive(str(tmp_path / "missing.txt")) == set()
+
+
+def test_download_progress_throttles_by_bytes() -> None:
+    events: list[dict] = []
+    progress = downloader.DownloadProgress(events.append)
+
+    for downloaded in (1, 10, 25, 40, 50):
+        progress({"status": "downloading", "downloaded_bytes": downloaded, "total_bytes": 1000})
+    progress({"status": "finished", "filename": "/tmp/a.mp4"})
+    progress({"status": "downloading", "downloaded_bytes": 1, "total_bytes": 1000})
+
+    assert [e.get("downloaded_bytes") for e in events] == [25, 50, None, 1]
+    assert events[0]["percentage"] == 2.5
+
+
+def test_download_progress_rate_limits_unknown_total() -> None:
+    events: list[dict] = []
+    progress = downloader.DownloadProgress(events.append)
+
+    progress({"status": "downloading", "downloaded_bytes": 1})
+    progress({"status": "downloading", "downloaded_bytes": 2})
+
+    assert len(events) == 1
+    assert events[0]["percentage"] == 0
+
+
+class _FakeYDL:
+    def __init__(self, opts: dict) -> None:
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+def _settings(tmp_path, **overrides) -> downloader.Settings:
+    return downloader.Settings(
+        out_dir=str(tmp_path),
+        archive_file=str(tmp_path / "archive.txt"),
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_video_sleeps_between_entries_without_blocking(tmp_path, monkeypatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(downloader, "_extract_entries", lambda url, limit: ["u1", "u2", "u3"])
+    monkeypatch.setattr(downloader, "YoutubeDL", _FakeYDL)
+    monkeypatch.setattr(
+        downloader,
+        "_download_entry",
+        lambda ydl, video_url, settings: ({"url": video_url, "status": "success"}, None),
+    )
+    monkeypatch.setattr(downloader.asyncio, "sleep", fake_sleep)
+
+    result = await downloader.download_video("u", _settings(tmp_path, delay_between_downloads=3))
+
+    assert result["status"] == "completed"
+    assert [r["url"] for r in result["results"]] == ["u1", "u2", "u3"]
+    assert sleeps == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_download_video_skips_entries_already_archived(tmp_path, monkeypatch) -> None:
+    downloaded: list[str] = []
+
+    def fake_entry(ydl, video_url, settings):
+        downloaded.append(video_url)
+        return {"url": video_url, "status": "success"}, None
+
+    monkeypatch.setattr(downloader, "_extract_entries", lambda url, limit: ["u1", "u2"])
+    monkeypatch.setattr(downloader, "YoutubeDL", _FakeYDL)
+    monkeypatch.setattr(downloader, "_download_entry", fake_entry)
+
+    result = await downloader.download_video("u", _settings(tmp_path, archive_id="job-1"))
+
+    assert downloaded == ["u1"]
+    assert [r["status"] for r in result["results"]] == ["success", "skipped"]
+
+
+@pytest.mark.asyncio
+async def test_download_video_runs_entries_in_parallel_when_workers_allow(tmp_path, monkeypatch) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    instances: list[_FakeYDL] = []
+
+    class _TrackingYDL(_FakeYDL):
+        def __init__(self, opts: dict) -> None:
+            super().__init__(opts)
+            instances.append(self)
+
+    def fake_entry(ydl, video_url, settings):
+        if video_url in ("u1", "u2"):
+            barrier.wait()  # both first entries must be in flight at once
+        return {"url": video_url, "status": "success"}, None
+
+    monkeypatch.setattr(downloader, "_extract_entries", lambda url, limit: ["u1", "u2", "u3"])
+    monkeypatch.setattr(downloader, "YoutubeDL", _TrackingYDL)
+    monkeypatch.setattr(downloader, "_download_entry", fake_entry)
+
+    result = await downloader.download_video("u", _settings(tmp_path, workers=2))
+
+    assert [r["url"] for r in result["results"]] == ["u1", "u2", "u3"]
+    assert len(instances) == 2
+
+
+def test_settings_are_frozen_and_hashable(tmp_path) -> None:
+    settings = _settings(tmp_path)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.max_res = 720
+    assert hash(settings) == hash(dataclasses.replace(settings))
+
+
+def test_base_opts_cached_template_is_not_shared() -> None:
+    settings = downloader.Settings(out_dir="/tmp/out", archive_file="/tmp/a.txt", audio_only=True, referer="https://x")
+
+    first = downloader._base_opts(settings)
+    first["http_headers"]["X-Test"] = "1"
+    first["postprocessors"][0]["preferredcodec"] = "wav"
+    first["subtitleslangs"].append("es")
+    first["progress_hooks"] = []
+
+    second = downloader._base_opts(settings)
+    assert second["http_headers"] == {"User-Agent": "yt-archiver", "Referer": "https://x"}
+    assert second["postprocessors"][0]["preferredcodec"] == "mp3"
+    assert second["subtitleslangs"] == ["pt", "en"]
+    assert "progress_hooks" not in second
+    assert downloader._cached_base_opts.cache_info().hits >= 1
@@ -0,0 +1,72 @@
+"""
+Unit tests for download request schemas.
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.core.constants import ValidationLimits
+from app.core.validators import validate_url
+from app.downloads.schemas import (
+    DownloadRequest,
+    DownloadResponse,
+    VideoInfoRequest,
+    VideoInfoResponse,
+)
+
+
+def test_download_request_rejects_unknown_fields() -> None:
+    with pytest.raises(ValidationError):
+        DownloadRequest(url="https://youtu.be/abc", max_resolution=720)
+
+
+def test_download_request_is_frozen() -> None:
+    request = DownloadRequest(url="https://youtu.be/abc")
+    with pytest.raises(ValidationError):
+        request.max_res = 720
+
+
+def test_video_info_request_rejects_unknown_fields() -> None:
+    with pytest.raises(ValidationError):
+        VideoInfoRequest(url="https://youtu.be/abc", extra=True)
+
+
+def test_download_request_validators_are_memoized() -> None:
+    validate_url.cache_clear()
+    payload = {
+        "url": "https://www.youtube.com/watch?v=abc",
+        "referer": "https://www.youtube.com/",
+    }
+    DownloadRequest(**payload)
+    DownloadRequest(**payload)
+    assert validate_url.cache_info().hits >= 2
+
+
+def test_video_info_response_drops_playlist_preview() -> None:
+    response = VideoInfoResponse.model_validate(
+        {
+            "status": "success",
+            "type": "playlist",
+            "title": "Mix",
+            "video_count": 2,
+            "videos": [{"id": "a"}, {"id": "b"}],
+        }
+    )
+    assert response.video_count == 2
+    assert "videos" not in response.model_dump()
+    with pytest.raises(ValidationError):
+        response.title = "other"
+
+
+def test_download_response_rejects_unknown_fields() -> None:
+    with pytest.raises(ValidationError):
+        DownloadResponse(status="success", job_id="job-1", message="ok", extra="x")
+
+
+@pytest.mark.parametrize("field", ["url", "referer", "origin", "path", "file_name"])
+def test_download_request_rejects_oversized_fields(field: str) -> None:
+    payload = {"url": "https://www.youtube.com/watch?v=abc"}
+    payload[field] = "https://a/" + "x" * ValidationLimits.MAX_PATH_LENGTH
+    validate_url.cache_clear()
+    with pytest.raises(ValidationError):
+        DownloadRequest(**payload)
+    assert validate_url.cache_info().currsize <= 1
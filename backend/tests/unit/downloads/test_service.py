@@ -0,0 +1,45 @@
+"""
+Unit tests for download service helpers.
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.downloads.downloader import Settings
+from app.downloads.schemas import DownloadRequest
+from app.downloads.service import settings_from_request
+
+
+def test_settings_from_request_maps_request_fields() -> None:
+    request = DownloadRequest(
+        url="https://www.youtube.com/watch?v=abc",
+        max_res=720,
+        sub_langs="en",
+        path="channel",
+        file_name="clip",
+        batch_size=5,
+        randomize_delay=True,
+    )
+
+    settings = settings_from_request(request, "/downloads")
+
+    assert settings == Settings(
+        out_dir="/downloads",
+        archive_file="./archive.txt",
+        max_res=720,
+        sub_langs="en",
+        custom_path="channel",
+        file_name="clip",
+        batch_size=5,
+        randomize_delay=True,
+    )
+
+
+def test_settings_from_request_passes_worker_count() -> None:
+    request = DownloadRequest(url="https://www.youtube.com/playlist?list=PL1", workers=3)
+
+    assert settings_from_request(request, "/downloads").workers == 3
+
+
+def test_download_request_caps_worker_count() -> None:
+    with pytest.raises(ValidationError):
+        DownloadRequest(url="https://www.youtube.com/playlist?list=PL1", workers=5)
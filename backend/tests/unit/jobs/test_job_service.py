@@ -1,12 +1,19 @@
 """
 Unit tests for jobs service state transitions.
 """
+import asyncio
 from typing import Dict
 
 import pytest
 
 from app.jobs import store as jobs_store
-from app.jobs.service import update_job_progress, complete_job, fail_job, cancel_job
+from app.jobs.service import (
+    ProgressCoalescer,
+    update_job_progress,
+    complete_job,
+    fail_job,
+    cancel_job,
+)
 from app.jobs.store import InMemoryJobStore
 
 
@@ -69,3 +76,75 @@ def test_cancel_job_marks_cancelled(memory_job_store: Dict[str, dict]) -> None:
     assert job["status"] == "cancelled"
     assert job["error"] == "Download cancelado pelo usuário"
     assert "completed_at" in job
+
+
+def test_scan_recent_videos_filters_by_extension_and_mtime(tmp_path) -> None:
+    import os
+
+    from app.jobs.service import _scan_recent_videos
+
+    (tmp_path / "sub").mkdir()
+    new_video = tmp_path / "sub" / "new.MP4"
+    old_video = tmp_path / "old.mkv"
+    other = tmp_path / "new.info.json"
+    for f in (new_video, old_video, other):
+        f.write_bytes(b"x")
+    os.utime(old_video, (1000, 1000))
+
+    assert _scan_recent_videos(tmp_path, since_ts=2000) == [new_video]
+    assert _scan_recent_videos(tmp_path / "missing", since_ts=0) == []
+
+
+def test_progress_coalescer_keeps_latest_downloading_tick(memory_job_store: Dict[str, dict]) -> None:
+    job_id = "job-coalesce"
+    _seed_job(job_id)
+    coalescer = ProgressCoalescer(job_id)
+
+    coalescer.push({"status": "downloading", "percent": 10})
+    coalescer.push({"status": "downloading", "percent": 20})
+    assert jobs_store.get_job(job_id)["progress"] == {}
+
+    coalescer.flush()
+    assert jobs_store.get_job(job_id)["progress"]["percent"] == 20
+
+
+def test_progress_coalescer_latest_event_wins(memory_job_store: Dict[str, dict]) -> None:
+    job_id = "job-finished"
+    _seed_job(job_id)
+    coalescer = ProgressCoalescer(job_id)
+
+    coalescer.push({"status": "downloading", "percent": 90})
+    coalescer.push({"status": "finished", "filepath": "/tmp/a.mp4"})
+    assert jobs_store.get_job(job_id)["progress"] == {}
+
+    coalescer.flush()
+    assert jobs_store.get_job(job_id)["progress"]["status"] == "finished"
+
+
+def test_progress_coalescer_close_drops_pending(memory_job_store: Dict[str, dict]) -> None:
+    job_id = "job-closed"
+    _seed_job(job_id)
+    coalescer = ProgressCoalescer(job_id)
+
+    coalescer.push({"status": "downloading", "percent": 50})
+    coalescer.close()
+    coalescer.push({"status": "downloading", "percent": 60})
+    coalescer.flush()
+
+    assert jobs_store.get_job(job_id)["progress"] == {}
+
+
+async def test_progress_coalescer_run_flushes_on_stop(memory_job_store: Dict[str, dict]) -> None:
+    job_id = "job-run"
+    _seed_job(job_id)
+    coalescer = ProgressCoalescer(job_id)
+    stop = asyncio.Event()
+    runner = asyncio.create_task(coalescer.run(stop, interval=60))
+
+    coalescer.push({"status": "downloading", "percent": 70})
+    stop.set()
+    await asyncio.wait_for(runner, timeout=1)
+
+    job = jobs_store.get_job(job_id)
+    assert job["status"] == "downloading"
+    assert job["progress"]["percent"] == 70
@@ -0,0 +1,55 @@
+"""
+Unit tests for derived Settings properties.
+"""
+import pytest
+
+from app.config import Settings
+
+
+def test_cors_origins_parsed_once_from_comma_string(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert Settings(CORS_ORIGINS="http://a, http://b,").CORS_ORIGINS == ("http://a", "http://b")
+
+    monkeypatch.setenv("CORS_ORIGINS", "http://env-a,http://env-b")
+    assert Settings().CORS_ORIGINS == ("http://env-a", "http://env-b")
+
+
+def test_derived_properties_are_cached() -> None:
+    s = Settings(CATALOG_DB_PATH="catalog/test.db")
+    first = s.catalog_db_path
+    assert first.endswith("catalog/test.db")
+    assert s.catalog_db_path is first
+
+
+def test_reassigning_source_field_invalidates_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    s = Settings(WORKER_ROLE="both", CATALOG_DB_PATH=":memory:")
+    assert s.start_background_tasks is True
+    assert s.catalog_db_path == ":memory:"
+
+    monkeypatch.setattr(s, "WORKER_ROLE", "api")
+    monkeypatch.setattr(s, "CATALOG_DB_PATH", "catalog/test.db")
+
+    assert s.start_background_tasks is False
+    assert s.catalog_db_path.endswith("catalog/test.db")
+
+
+def test_static_constants_are_shared_read_only_objects() -> None:
+    from app.core.constants import FileExtensions, MimeTypes
+
+    s = Settings()
+    assert s.VIDEO_EXTENSIONS is FileExtensions.VIDEO
+    assert s.THUMBNAIL_EXTENSIONS is FileExtensions.THUMBNAIL
+    assert s.VIDEO_MIME_TYPES is MimeTypes.VIDEO
+    assert s.IMAGE_MIME_TYPES is MimeTypes.IMAGE
+    assert "VIDEO_EXTENSIONS" not in s.model_dump()
+    assert isinstance(s.THUMBNAIL_EXTENSIONS, tuple)
+    assert s.DRIVE_UPLOAD_RETRY_STATUSES == frozenset({429, 500, 502, 503, 504})
+
+    with pytest.raises(TypeError):
+        s.VIDEO_MIME_TYPES[".mp4"] = "video/other"  # type: ignore[index]
+
+
+def test_get_settings_returns_module_singleton() -> None:
+    from app.config import get_settings, settings
+
+    assert get_settings() is settings
+    assert get_settings() is get_settings()